@@ -5,7 +5,11 @@ import sys
 
 from flask import Flask, jsonify, redirect, render_template, request, url_for
 
-from recommender_system.pipeline import RecommendProducts
+from recommender_system.logging import logger
+from recommender_system.utils import get_memory_usage
+from recommender_system.pipeline import (get_cache_stats,
+                                         get_recommender_engine,
+                                         reload_recommender_engine)
 
 app = Flask(__name__)
 app.secret_key = secrets.token_hex(16)
@@ -22,6 +26,7 @@ def train():
     """Triggers the training process."""
     venv_activate_script = get_activate_script()
     subprocess.call([venv_activate_script, "&&", "python", "main.py"], shell=True)
+    reload_recommender_engine()
     return redirect(url_for("index"))
 
 
@@ -30,11 +35,40 @@ def recommend():
     """Generates recommendations based on provided reviewer ID and number of items."""
     reviewer_id = request.json["reviewerId"]
     num_items = int(request.json["numItems"])
-    recommendation_system = RecommendProducts(reviewer_id)
-    recommendations = recommendation_system.recommend_products(num_items)
+    engine = get_recommender_engine()
+    recommendations = engine.recommend(reviewer_id, num_items)
     return jsonify({"recommendations": recommendations.to_dict("records")})
 
 
+@app.route("/recommend/batch", methods=["POST"])
+def recommend_batch():
+    """Generates recommendations for several reviewer IDs in one call."""
+    reviewer_ids = request.json["reviewerIds"]
+    num_items = int(request.json["numItems"])
+    engine = get_recommender_engine()
+    recommendations = engine.recommend_many(reviewer_ids, num_items)
+    return jsonify(
+        {
+            "recommendations": {
+                reviewer_id: reviewer_recommendations.to_dict("records")
+                for reviewer_id, reviewer_recommendations in recommendations.items()
+            }
+        }
+    )
+
+
+@app.route("/cache/stats")
+def cache_stats():
+    """Returns the recommendation cache counters."""
+    return jsonify(get_cache_stats())
+
+
+@app.route("/memory")
+def memory():
+    """Returns the memory usage of the worker process serving the request."""
+    return jsonify({"pid": os.getpid(), **get_memory_usage()})
+
+
 def get_activate_script():
     """Returns the path to the virtual environment's activate script."""
     if sys.platform.startswith("win"):
@@ -43,5 +77,14 @@ def get_activate_script():
         return os.path.join(os.environ.get("VIRTUAL_ENV"), "bin", "activate")
 
 
+def warm_up_engine():
+    """Loads the recommender engine at startup if a trained model is available."""
+    try:
+        get_recommender_engine()
+    except (OSError, IOError) as e:
+        logger.warning(f"Recommender engine not loaded at startup: {str(e)}")
+
+
 if __name__ == "__main__":
+    warm_up_engine()
     app.run(debug=False, port=8000)
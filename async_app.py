@@ -0,0 +1,55 @@
+from aiohttp import web
+
+from recommender_system.components import MicroBatcher
+from recommender_system.config import ConfigurationManager
+from recommender_system.pipeline import get_recommender_engine
+
+
+def recommend_many(reviewer_ids, num_items):
+    """Recommends products for a batch of reviewer IDs, in request order."""
+    return get_recommender_engine().recommend_in_order(reviewer_ids, num_items)
+
+
+async def recommend(request):
+    """Generates recommendations based on provided reviewer ID and number of items."""
+    payload = await request.json()
+    reviewer_id = payload["reviewerId"]
+    num_items = int(payload["numItems"])
+    recommendations = await request.app["batcher"].submit(reviewer_id, num_items)
+    return web.json_response({"recommendations": recommendations.to_dict("records")})
+
+
+async def batcher_stats(request):
+    """Returns the micro-batching counters."""
+    return web.json_response(request.app["batcher"].stats())
+
+
+async def start_batcher(app):
+    """Loads the recommender engine and starts the micro-batcher."""
+    inference_config = ConfigurationManager().get_inference_config()
+    get_recommender_engine()
+    app["batcher"] = MicroBatcher(
+        recommend_many,
+        max_batch_size=inference_config.max_batch_size,
+        max_wait_ms=inference_config.max_wait_ms
+    )
+    await app["batcher"].start()
+
+
+async def stop_batcher(app):
+    """Stops the micro-batcher."""
+    await app["batcher"].stop()
+
+
+def create_app():
+    """Creates the asyncio web application."""
+    app = web.Application()
+    app.router.add_post("/recommend", recommend)
+    app.router.add_get("/batcher/stats", batcher_stats)
+    app.on_startup.append(start_batcher)
+    app.on_cleanup.append(stop_batcher)
+    return app
+
+
+if __name__ == "__main__":
+    web.run_app(create_app(), port=8080)
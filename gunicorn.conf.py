@@ -0,0 +1,13 @@
+import os
+
+bind = "0.0.0.0:8000"
+workers = int(os.environ.get("WEB_CONCURRENCY", 4))
+preload_app = os.environ.get("PRELOAD_RECOMMENDER_ENGINE", "1") == "1"
+
+
+def when_ready(server):
+    """Opens the recommender engine once in the parent before workers are forked."""
+    if preload_app:
+        from recommender_system.pipeline import get_recommender_engine
+
+        get_recommender_engine()
@@ -0,0 +1,71 @@
+import argparse
+import subprocess
+import sys
+
+TRAINING_MODULES = (
+    "tensorflow",
+    "keras",
+    "recommender_system.components.build_model",
+    "recommender_system.components.train_model",
+    "recommender_system.components.evaluate_model"
+)
+
+
+def parse_args():
+    """Parses the command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Measures import time and checks no training modules are loaded."
+    )
+    parser.add_argument(
+        "--module", default="recommender_system.pipeline.stage_06_inference"
+    )
+    parser.add_argument("--top", type=int, default=10)
+    return parser.parse_args()
+
+
+def measure_import(module):
+    """Imports a module in a fresh interpreter and returns its import-time records."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    records = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        records.append((name.strip(), int(self_us), int(cumulative_us)))
+
+    return records
+
+
+def main(args):
+    """Reports the import time and fails if training modules were imported."""
+    records = measure_import(args.module)
+    loaded = {name for name, _, _ in records}
+    total_us = next(
+        cumulative for name, _, cumulative in records if name == args.module
+    )
+
+    print(f"Import of {args.module}: {total_us / 1000:.1f} ms, {len(loaded)} modules")
+    slowest = sorted(records, key=lambda record: record[1], reverse=True)
+    for name, self_us, _ in slowest[:args.top]:
+        print(f"  {self_us / 1000:8.1f} ms  {name}")
+
+    training_modules = sorted(
+        name
+        for name in loaded
+        if any(name == m or name.startswith(f"{m}.") for m in TRAINING_MODULES)
+    )
+    if training_modules:
+        print(f"Training modules imported: {', '.join(training_modules)}")
+        sys.exit(1)
+
+    print("No training modules imported")
+
+
+if __name__ == "__main__":
+    main(parse_args())
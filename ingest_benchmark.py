@@ -0,0 +1,86 @@
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+
+INGEST_METHODS = {
+    "read_json": """
+import pandas as pd
+df = pd.read_json(data_path, lines=True)
+df = df[["reviewerID", "asin", "overall", "unixReviewTime"]]
+rows = len(df)
+""",
+    "parse": """
+from recommender_system.components import ReviewColumns
+review_columns = ReviewColumns.parse([data_path], chunk_size)
+review_columns.save(columns_dir, get_file_hash(Path(data_path)))
+rows = len(review_columns.to_frame())
+""",
+    "cache": """
+from recommender_system.components import ReviewColumns
+review_columns = ReviewColumns.load(columns_dir, get_file_hash(Path(data_path)))
+rows = len(review_columns.to_frame())
+"""
+}
+
+RUNNER = """
+import json
+import resource
+import sys
+import time
+from pathlib import Path
+from recommender_system.utils import get_file_hash
+data_path, columns_dir, chunk_size = sys.argv[1], sys.argv[2], int(sys.argv[3])
+start_time = time.perf_counter()
+{method}
+elapsed = time.perf_counter() - start_time
+peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{"rows": rows, "seconds": elapsed, "peak_rss_kb": peak_kb}}))
+"""
+
+
+def parse_args():
+    """Parses the command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Compares parse time and peak memory of the review ingest paths."
+    )
+    parser.add_argument("--data-path", default="artifacts/data_ingestion/data.gz")
+    parser.add_argument("--chunk-size", type=int, default=100000)
+    return parser.parse_args()
+
+
+def measure_method(method, data_path, columns_dir, chunk_size):
+    """Runs an ingest method in a fresh interpreter and returns its measurements."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            RUNNER.format(method=INGEST_METHODS[method]),
+            data_path,
+            columns_dir,
+            str(chunk_size)
+        ],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def main(args):
+    """Reports the parse time and peak resident memory of each ingest path."""
+    with tempfile.TemporaryDirectory() as columns_dir:
+        for method in INGEST_METHODS:
+            measurement = measure_method(
+                method, args.data_path, columns_dir, args.chunk_size
+            )
+            print(
+                f"{method:>10}: {measurement['rows']} rows in "
+                f"{measurement['seconds']:.2f} s, "
+                f"peak RSS {measurement['peak_rss_kb'] / 1024:.0f} MB"
+            )
+
+
+if __name__ == "__main__":
+    main(parse_args())
@@ -0,0 +1,60 @@
+import argparse
+import asyncio
+import random
+import time
+
+import aiohttp
+
+
+def parse_args():
+    """Parses the command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Sends concurrent recommendation requests and reports throughput."
+    )
+    parser.add_argument("--url", default="http://localhost:8080/recommend")
+    parser.add_argument("--reviewer-ids", nargs="+", required=True)
+    parser.add_argument("--num-items", type=int, default=5)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    return parser.parse_args()
+
+
+async def worker(session, args, remaining, latencies):
+    """Sends requests until the shared budget is used up."""
+    while remaining[0] > 0:
+        remaining[0] -= 1
+        payload = {
+            "reviewerId": random.choice(args.reviewer_ids),
+            "numItems": args.num_items
+        }
+        start_time = time.perf_counter()
+        async with session.post(args.url, json=payload) as response:
+            await response.read()
+            response.raise_for_status()
+        latencies.append(time.perf_counter() - start_time)
+
+
+async def main(args):
+    """Runs the load test and prints the throughput and latency percentiles."""
+    remaining = [args.requests]
+    latencies = []
+
+    async with aiohttp.ClientSession() as session:
+        start_time = time.perf_counter()
+        await asyncio.gather(
+            *[
+                worker(session, args, remaining, latencies)
+                for _ in range(args.concurrency)
+            ]
+        )
+        elapsed = time.perf_counter() - start_time
+
+    latencies.sort()
+    print(f"Requests: {len(latencies)}, concurrency: {args.concurrency}")
+    print(f"Throughput: {len(latencies) / elapsed:.1f} requests/s")
+    print(f"Latency p50: {1000 * latencies[len(latencies) // 2]:.1f} ms")
+    print(f"Latency p99: {1000 * latencies[int(len(latencies) * 0.99) - 1]:.1f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
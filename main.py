@@ -1,23 +1,77 @@
+import argparse
+import time
+from pathlib import Path
+
+import recommender_system
+from recommender_system import pipeline
+from recommender_system.components import StageCache, StageScheduler
+from recommender_system.config import ConfigurationManager
+from recommender_system.constants import CONFIG_FILE_PATH, PARAMS_FILE_PATH
 from recommender_system.logging import logger
-from recommender_system.pipeline import (DataIngestionPipeline,
-                                         DataPreprocessingPipeline,
-                                         ModelBuilderPipeline,
-                                         ModelEvaluationPipeline,
-                                         ModelTrainerPipeline)
-
-pipeline_configs = [
-    ("Data Ingestion", DataIngestionPipeline()),
-    ("Data Preprocessing", DataPreprocessingPipeline()),
-    ("Build Model", ModelBuilderPipeline()),
-    ("Train Model", ModelTrainerPipeline()),
-    ("Evaluate Model", ModelEvaluationPipeline())
-]
-
-for stage_name, pipeline in pipeline_configs:
+from recommender_system.utils import read_yaml
+
+
+def parse_args(stage_names):
+    """Parses the command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Runs the pipeline stages, skipping those with unchanged inputs."
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="Run every stage regardless of the cache."
+    )
+    parser.add_argument(
+        "--from-stage",
+        choices=stage_names,
+        help="Run this stage and every later one regardless of the cache."
+    )
+    return parser.parse_args()
+
+
+def run_stage(stage_name, pipeline_name):
+    """Runs one stage in a worker process and returns its duration in seconds."""
+    start_time = time.perf_counter()
     try:
         logger.info(f"===== Stage {stage_name} started =====")
-        pipeline.main()
-        logger.info(f"===== Stage {stage_name} completed =====")
+        getattr(pipeline, pipeline_name)().main()
+        seconds = time.perf_counter() - start_time
+        logger.info(f"===== Stage {stage_name} completed ({seconds:.2f} s) =====")
     except Exception as e:
         logger.exception(f"Error occurred in stage {stage_name}: {str(e)}")
         raise e
+
+    return seconds
+
+
+def read_params():
+    """Reads the current params, including those written by earlier stages."""
+    return read_yaml(PARAMS_FILE_PATH)
+
+
+def run_stages(stages, max_workers, force=False, from_stage=None):
+    """Runs the stages as a dependency graph, skipping those with unchanged inputs."""
+    stage_cache = StageCache(
+        CONFIG_FILE_PATH, Path(recommender_system.__file__).parent
+    )
+    stage_scheduler = StageScheduler(stages, stage_cache, max_workers)
+
+    start_time = time.perf_counter()
+    timings = stage_scheduler.run(run_stage, read_params, force, from_stage)
+    wall_seconds = time.perf_counter() - start_time
+
+    for stage_name, status, seconds in timings:
+        logger.info(f"{stage_name:<28} {status:<9} {seconds:8.2f} s")
+    logger.info(f"Pipeline wall time: {wall_seconds:.2f} s")
+
+    return timings
+
+
+if __name__ == "__main__":
+    config_manager = ConfigurationManager()
+    stages = config_manager.get_stage_configs()
+    args = parse_args([stage.name for stage in stages])
+    run_stages(
+        stages,
+        config_manager.params.PIPELINE_WORKERS,
+        force=args.force,
+        from_stage=args.from_stage
+    )
@@ -0,0 +1,90 @@
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+
+PREPROCESSING_PATHS = {"in_memory": False, "chunked": True}
+
+RUNNER = """
+import json
+import sys
+from dataclasses import replace
+from pathlib import Path
+from recommender_system.components import ArrayStore, DataPreprocessor
+from recommender_system.config import ConfigurationManager
+from recommender_system.utils import get_file_hash
+root_dir, chunked = Path(sys.argv[1]), json.loads(sys.argv[2])
+root_dir.mkdir(parents=True)
+config = replace(
+    ConfigurationManager().get_data_preprocessing_config(),
+    root_dir=root_dir,
+    review_columns_path=root_dir / "review_columns",
+    chunked=chunked,
+    incremental=False
+)
+data_preprocessor = DataPreprocessor(config)
+if chunked:
+    data_preprocessor.load_data_chunked()
+else:
+    data_preprocessor.load_data()
+    data_preprocessor.encode_labels()
+data_preprocessor.calculate_statistics()
+data_preprocessor.build_popularity_index()
+data_preprocessor.prepare_data()
+data_preprocessor.save_preprocessed_data()
+hashes = {
+    name: entry["sha256"]
+    for name, entry in ArrayStore(root_dir).read_manifest().items()
+}
+hashes["preprocessed_data.bin"] = get_file_hash(root_dir / "preprocessed_data.bin")
+print(json.dumps(hashes))
+"""
+
+
+def parse_args():
+    """Parses the command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Checks that chunked and in-memory preprocessing save equal arrays."
+    )
+    return parser.parse_args()
+
+
+def run_path(path, root_dir):
+    """Preprocesses along a path in a fresh interpreter and returns the file hashes."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            RUNNER,
+            f"{root_dir}/{path}",
+            json.dumps(PREPROCESSING_PATHS[path])
+        ],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def main(args):
+    """Compares the saved arrays of each preprocessing path with the in-memory one."""
+    with tempfile.TemporaryDirectory() as root_dir:
+        hashes = {path: run_path(path, root_dir) for path in PREPROCESSING_PATHS}
+
+    expected = hashes["in_memory"]
+    mismatches = 0
+    for path, path_hashes in hashes.items():
+        for name in sorted(expected.keys() | path_hashes.keys()):
+            if path_hashes.get(name) != expected.get(name):
+                mismatches += 1
+                print(f"{path:>10}: {name} differs from the in-memory output")
+
+    if mismatches:
+        sys.exit(1)
+
+    print(f"All {len(expected)} saved arrays are byte-identical across the paths")
+
+
+if __name__ == "__main__":
+    main(parse_args())
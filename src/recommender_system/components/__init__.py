@@ -1,5 +1,44 @@
-from recommender_system.components.build_model import ModelBuilder
-from recommender_system.components.data_ingestion import DataIngestion
-from recommender_system.components.data_preprocessing import DataPreprocessor
-from recommender_system.components.evaluate_model import EvaluateModel
-from recommender_system.components.train_model import ModelTrainer
+import importlib
+
+_COMPONENT_MODULES = {
+    "AnnIndexBuilder": "recommender_system.components.ann_index",
+    "IVFIndex": "recommender_system.components.ann_index",
+    "ArrayStore": "recommender_system.components.array_store",
+    "ModelBuilder": "recommender_system.components.build_model",
+    "DataIngestion": "recommender_system.components.data_ingestion",
+    "DataPreprocessor": "recommender_system.components.data_preprocessing",
+    "EvaluateCascade": "recommender_system.components.evaluate_cascade",
+    "EvaluateModel": "recommender_system.components.evaluate_model",
+    "ModelExporter": "recommender_system.components.export_model",
+    "MicroBatcher": "recommender_system.components.micro_batcher",
+    "NumpyScorer": "recommender_system.components.numpy_scorer",
+    "QuantizedTable": "recommender_system.components.quantization",
+    "RecommendationPrecomputer": (
+        "recommender_system.components.precompute_recommendations"
+    ),
+    "RecommendationCache": "recommender_system.components.recommendation_cache",
+    "ReviewColumns": "recommender_system.components.review_columns",
+    "ReviewTable": "recommender_system.components.review_table",
+    "ServingBundle": "recommender_system.components.serving_bundle",
+    "ServingVersion": "recommender_system.components.serving_version",
+    "StageCache": "recommender_system.components.stage_cache",
+    "StageScheduler": "recommender_system.components.stage_scheduler",
+    "ModelTrainer": "recommender_system.components.train_model",
+    "TrainingLoop": "recommender_system.components.training_loop",
+    "Vocabulary": "recommender_system.components.vocabulary"
+}
+
+__all__ = list(_COMPONENT_MODULES)
+
+
+def __getattr__(name):
+    """Imports a component's module on first access, so unused ones stay unloaded."""
+    if name not in _COMPONENT_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    return getattr(importlib.import_module(_COMPONENT_MODULES[name]), name)
+
+
+def __dir__():
+    """Lists the lazily loaded components alongside the module attributes."""
+    return sorted(list(globals()) + __all__)
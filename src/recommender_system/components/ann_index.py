@@ -0,0 +1,155 @@
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+
+from recommender_system.components.numpy_scorer import NumpyScorer
+from recommender_system.logging import logger
+
+
+class IVFIndex:
+    def __init__(self, vectors, centroids, list_indptr, list_indices):
+        """Initialises the IVFIndex object with vectors partitioned into lists."""
+        self.vectors = vectors
+        self.centroids = centroids
+        self.list_indptr = list_indptr
+        self.list_indices = list_indices
+
+    @staticmethod
+    def assign(vectors, squared_norms, centroids):
+        """Returns each vector's nearest centroid and the size of every list."""
+        distances = (
+            squared_norms - 2 * vectors @ centroids.T + np.sum(centroids**2, axis=1)
+        )
+        assignments = np.argmin(distances, axis=1)
+        return assignments, np.bincount(assignments, minlength=len(centroids))
+
+    @classmethod
+    def build(cls, vectors, number_of_lists, iterations, seed=42):
+        """Partitions the vectors into inverted lists using k-means clustering."""
+        rng = np.random.default_rng(seed)
+        number_of_lists = min(number_of_lists, len(vectors))
+        centroids = vectors[rng.choice(len(vectors), number_of_lists, replace=False)]
+        squared_norms = np.sum(vectors**2, axis=1, keepdims=True)
+
+        for _ in range(iterations):
+            assignments, counts = cls.assign(vectors, squared_norms, centroids)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignments, vectors)
+            non_empty = counts > 0
+            centroids[non_empty] = sums[non_empty] / counts[non_empty, np.newaxis]
+
+        assignments, counts = cls.assign(vectors, squared_norms, centroids)
+        list_indices = np.argsort(assignments, kind="stable").astype(np.int32)
+        list_indptr = np.zeros(number_of_lists + 1, dtype=np.int64)
+        np.cumsum(counts, out=list_indptr[1:])
+
+        return cls(vectors, centroids.astype(np.float32), list_indptr, list_indices)
+
+    @classmethod
+    def from_file(cls, index_path, vectors):
+        """Loads an IVFIndex over the given vectors from an index file."""
+        with np.load(index_path) as index:
+            return cls(
+                vectors, index["centroids"], index["list_indptr"], index["list_indices"]
+            )
+
+    def save(self, index_path):
+        """Saves the centroids and inverted lists of the index."""
+        np.savez(
+            index_path,
+            centroids=self.centroids,
+            list_indptr=self.list_indptr,
+            list_indices=self.list_indices
+        )
+
+    def probe(self, query, number_of_probes):
+        """Returns the vector IDs stored in the lists closest to the query."""
+        number_of_probes = min(number_of_probes, len(self.centroids))
+        centroid_scores = self.centroids @ query
+        probes = np.argpartition(-centroid_scores, number_of_probes - 1)[
+            :number_of_probes
+        ]
+        return np.concatenate(
+            [
+                self.list_indices[self.list_indptr[i]:self.list_indptr[i + 1]]
+                for i in probes
+            ]
+        )
+
+    def search(self, query, k, number_of_probes):
+        """Returns the IDs of the k vectors with the highest inner product."""
+        candidates = self.probe(query, number_of_probes)
+        scores = self.vectors[candidates] @ query
+        k = min(k, len(candidates))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return candidates[top]
+
+
+class AnnIndexBuilder:
+    def __init__(self, config):
+        """Initialises the AnnIndexBuilder object with the given config."""
+        self.config = config
+
+    def load_scorer(self):
+        """Loads the NumPy scorer from the exported model weights."""
+        self.scorer = NumpyScorer.from_file(self.config.model_weights_path)
+
+    def query_vectors(self, encoded_reviewer_ids):
+        """Returns the matrix factorisation query vectors of the given reviewers."""
+        return (
+            self.scorer.reviewer_embeddings[encoded_reviewer_ids]
+            * self.scorer.output_mf_kernel
+        )
+
+    def build_index(self):
+        """Builds and saves the IVF index over the product embedding table."""
+        self.load_scorer()
+        self.index = IVFIndex.build(
+            self.scorer.product_embeddings,
+            number_of_lists=self.config.number_of_lists,
+            iterations=self.config.iterations
+        )
+        self.index.save(self.config.index_path)
+        logger.info(f"Save ANN index at: {self.config.index_path}")
+
+    def evaluate_recall(self, k=10, sample_size=1000, seed=42):
+        """Reports recall@k and latency of the index against exact search."""
+        rng = np.random.default_rng(seed)
+        number_of_reviewers = len(self.scorer.reviewer_embeddings)
+        sample = rng.choice(
+            number_of_reviewers, min(sample_size, number_of_reviewers), replace=False
+        )
+        queries = self.query_vectors(sample)
+        exact_scores = queries @ self.scorer.product_embeddings.T
+        exact_top = np.argpartition(-exact_scores, k - 1, axis=1)[:, :k]
+
+        results = []
+        number_of_probes = 1
+        while True:
+            number_of_probes = min(number_of_probes, len(self.index.centroids))
+            hits = 0
+            start_time = time.perf_counter()
+            for query, exact in zip(queries, exact_top):
+                approximate = self.index.search(query, k, number_of_probes)
+                hits += len(np.intersect1d(approximate, exact))
+            elapsed = time.perf_counter() - start_time
+
+            results.append(
+                {
+                    "number_of_probes": int(number_of_probes),
+                    f"recall@{k}": hits / (k * len(queries)),
+                    "latency_ms": 1000 * elapsed / len(queries)
+                }
+            )
+            if number_of_probes == len(self.index.centroids):
+                break
+            number_of_probes *= 2
+
+        results_filepath = Path(self.config.root_dir) / "ann_recall.json"
+        with open(results_filepath, "w") as f:
+            json.dump(results, f, indent=4)
+
+        return results
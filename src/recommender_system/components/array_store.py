@@ -0,0 +1,54 @@
+import pickle
+from pathlib import Path
+
+import numpy as np
+
+from recommender_system.utils import get_file_hash, load_json, save_json
+
+ARRAY_MANIFEST = "arrays.json"
+
+
+class ArrayStore:
+    def __init__(self, directory):
+        """Initialises the ArrayStore object with the directory holding the arrays."""
+        self.directory = Path(directory)
+        self.manifest_path = self.directory / ARRAY_MANIFEST
+
+    def read_manifest(self):
+        """Returns the manifest of stored arrays, or an empty one if none exists."""
+        if not self.manifest_path.exists():
+            return {}
+
+        return load_json(self.manifest_path)
+
+    def save(self, arrays):
+        """Saves named arrays as .npy files with a manifest of dtypes and hashes."""
+        manifest = self.read_manifest()
+        for name, array in arrays.items():
+            array_path = self.directory / f"{name}.npy"
+            np.save(array_path, np.ascontiguousarray(array))
+            manifest[name] = {
+                "dtype": np.asarray(array).dtype.str,
+                "shape": list(np.shape(array)),
+                "sha256": get_file_hash(array_path)
+            }
+
+        save_json(self.manifest_path, dict(manifest))
+
+    def load(self, name, verify=False):
+        """Memory-maps a stored array, falling back to a legacy pickle if needed."""
+        manifest = self.read_manifest()
+        if name not in manifest:
+            with open(self.directory / f"{name}.pkl", "rb") as f:
+                return pickle.load(f)
+
+        entry = manifest[name]
+        array_path = self.directory / f"{name}.npy"
+        if verify and get_file_hash(array_path) != entry["sha256"]:
+            raise ValueError(f"Content hash mismatch for stored array: {array_path}")
+
+        array = np.load(array_path, mmap_mode="r")
+        if array.dtype.str != entry["dtype"] or list(array.shape) != entry["shape"]:
+            raise ValueError(f"Stored array does not match its manifest: {array_path}")
+
+        return array
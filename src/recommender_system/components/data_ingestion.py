@@ -1,8 +1,10 @@
 import gzip
-import json
 import os
+import shutil
 import urllib.request
 
+COPY_BUFFER_SIZE = 1024 * 1024
+
 
 class DataIngestion:
     def __init__(self, config):
@@ -17,9 +19,9 @@ class DataIngestion:
             )
 
     def extract_and_rename_json(self):
-        """Extracts and renames the JSON file from the gzipped data file."""
+        """Extracts and renames the JSON file from the gzipped data file in chunks."""
         json_file_path = os.path.join(self.config.unzip_directory, "data.json")
 
         with gzip.open(self.config.local_data_file_path, "rb") as gz_file:
             with open(json_file_path, "wb") as json_file:
-                json_file.write(gz_file.read())
+                shutil.copyfileobj(gz_file, json_file, COPY_BUFFER_SIZE)
@@ -1,58 +1,441 @@
+import hashlib
 import os
 import pickle
+import shutil
+import tempfile
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
 import yaml
-from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import LabelEncoder
 
+from recommender_system.components.array_store import ArrayStore
+from recommender_system.components.review_columns import ReviewColumns
+from recommender_system.components.review_table import ReviewTable
+from recommender_system.components.vocabulary import Vocabulary
 from recommender_system.logging import logger
-from recommender_system.utils import scale_targets
+from recommender_system.utils import atomic_write, get_file_hash, scale_targets
+
+SPILL_DTYPE = np.dtype(
+    [
+        ("reviewer", np.int64),
+        ("product", np.int64),
+        ("rating", np.float64),
+        ("review_time", np.int64)
+    ]
+)
+SPILL_PARTITIONS = 64
+VALIDATION_FRACTION = 0.2
 
 
 class DataPreprocessor:
     def __init__(self, config):
         """Initialises the DataPreprocessor object with the given config."""
         self.config = config
+        self.applied_deltas = []
+        self.reviewer_encoder = None
+        self.product_encoder = None
+
+    def get_applied_delta_paths(self):
+        """Returns the consumed delta files kept as part of the review history."""
+        if not self.config.applied_deltas_path.exists():
+            return []
+
+        return sorted(self.config.applied_deltas_path.glob("[!.]*"))
+
+    def get_source_paths(self):
+        """Returns the source file followed by every consumed delta file."""
+        return [self.config.data_path] + self.get_applied_delta_paths()
+
+    def get_source_hash(self):
+        """Returns the hash identifying the parsed review columns of the history."""
+        source_hash = hashlib.sha256(
+            get_file_hash(self.config.data_path).encode("utf-8")
+        )
+        for delta_path in self.get_applied_delta_paths():
+            source_hash.update(delta_path.name.encode("utf-8"))
+
+        return source_hash.hexdigest()
+
+    def keep_delta(self, delta_hash):
+        """Copies a delta into the review history, so full rebuilds include it."""
+        suffixes = "".join(self.config.delta_path.suffixes)
+        delta_path = self.config.applied_deltas_path / f"{delta_hash}{suffixes}"
+        if delta_path.exists():
+            return
+
+        self.config.applied_deltas_path.mkdir(parents=True, exist_ok=True)
+        with atomic_write(delta_path) as temporary_path:
+            shutil.copyfile(self.config.delta_path, temporary_path)
+
+    def extend_saved_vocabulary(self, name, ids):
+        """Returns the saved vocabulary extended with the IDs, and their codes in it."""
+        vocabulary_path = Path(self.config.root_dir) / f"{name}_vocabulary.npz"
+        if not vocabulary_path.exists():
+            return Vocabulary(ids), np.arange(len(ids), dtype=np.int32)
+
+        return Vocabulary.load(vocabulary_path).extend(ids)
+
+    @staticmethod
+    def build_label_encoder(vocabulary):
+        """Returns a LabelEncoder matching the vocabulary, or None if it is unsorted."""
+        ids = vocabulary.ids
+        if np.any(ids[1:] < ids[:-1]):
+            return None
+
+        label_encoder = LabelEncoder()
+        label_encoder.classes_ = ids.astype(object)
+        return label_encoder
+
+    def load_review_columns(self):
+        """Loads cached review columns, parsing the JSON only if the source changed."""
+        source_hash = self.get_source_hash()
+        review_columns = ReviewColumns.load(
+            self.config.review_columns_path, source_hash
+        )
+        if review_columns is not None:
+            logger.info(f"Load review columns from: {self.config.review_columns_path}")
+            return review_columns
+
+        review_columns = ReviewColumns.parse(
+            self.get_source_paths(), self.config.chunk_size
+        )
+        review_columns.save(self.config.review_columns_path, source_hash)
+        logger.info(f"Save review columns to: {self.config.review_columns_path}")
+        return review_columns
 
     def load_data(self):
         """Loads data from a JSON file and performs initial data preprocessing."""
-        self.df = pd.read_json(self.config.data_path, lines=True)
-        self.df = self.df[["reviewerID", "asin", "overall"]]
-        self.df = self.df.rename(columns={"asin": "productID", "overall": "rating"})
-        self.df = self.df.groupby(by=["reviewerID", "productID"], as_index=False).agg(
-            {"rating": "mean"}
+        self.applied_deltas = [
+            path.name.split(".")[0] for path in self.get_applied_delta_paths()
+        ]
+        self.df = self.load_review_columns().to_frame()
+        self.df = self.df.groupby(
+            by=["reviewerID", "productID"], as_index=False, observed=True
+        ).agg(
+            rating=("rating", "mean"),
+            ratingCount=("rating", "size"),
+            unixReviewTime=("unixReviewTime", "max")
+        )
+
+    def spill_partitions(self, spill_dir):
+        """Streams the reviews in chunks into a fixed number of reviewer partitions."""
+        review_columns = ReviewColumns.load(
+            self.config.review_columns_path, self.get_source_hash()
+        )
+        reviewer_index = {}
+        product_index = {}
+        if review_columns is not None:
+            chunks = review_columns.iter_chunks(self.config.chunk_size)
+        else:
+            chunks = ReviewColumns.iter_parsed_chunks(
+                self.get_source_paths(),
+                self.config.chunk_size,
+                reviewer_index,
+                product_index
+            )
+
+        partition_paths = [
+            Path(spill_dir) / f"partition_{partition}.bin"
+            for partition in range(SPILL_PARTITIONS)
+        ]
+        partition_files = [open(path, "wb") for path in partition_paths]
+
+        try:
+            for reviewer_codes, product_codes, ratings, review_times in chunks:
+                records = np.empty(len(ratings), dtype=SPILL_DTYPE)
+                records["reviewer"] = reviewer_codes
+                records["product"] = product_codes
+                records["rating"] = ratings
+                records["review_time"] = review_times
+
+                partitions = records["reviewer"] % SPILL_PARTITIONS
+                order = np.argsort(partitions, kind="stable")
+                bounds = np.searchsorted(
+                    partitions[order], np.arange(SPILL_PARTITIONS + 1)
+                )
+                for partition, partition_file in enumerate(partition_files):
+                    partition_records = records[
+                        order[bounds[partition]:bounds[partition + 1]]
+                    ]
+                    partition_file.write(partition_records.tobytes())
+        finally:
+            for partition_file in partition_files:
+                partition_file.close()
+
+        if review_columns is not None:
+            return (
+                partition_paths, review_columns.reviewer_ids, review_columns.product_ids
+            )
+
+        return (
+            partition_paths,
+            ReviewColumns.index_ids(reviewer_index),
+            ReviewColumns.index_ids(product_index)
+        )
+
+    @staticmethod
+    def aggregate_reviews(
+        reviewers, products, ratings, review_times, number_of_products
+    ):
+        """Averages the ratings of each reviewer and product pair, sorted by pair."""
+        keys = reviewers.astype(np.int64) * number_of_products + products
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+
+        counts = np.bincount(inverse, minlength=len(unique_keys))
+        sums = np.bincount(
+            inverse, weights=ratings.astype(np.float64), minlength=len(unique_keys)
+        )
+        latest_review_times = np.full(
+            len(unique_keys), np.iinfo(np.int64).min, dtype=np.int64
+        )
+        np.maximum.at(latest_review_times, inverse, review_times)
+
+        return (
+            unique_keys // number_of_products,
+            unique_keys % number_of_products,
+            sums / counts,
+            counts,
+            latest_review_times
+        )
+
+    def aggregate_partition(
+        self, partition_path, reviewer_codes, product_codes, number_of_products
+    ):
+        """Averages the ratings of each reviewer and product pair in one partition."""
+        records = np.fromfile(partition_path, dtype=SPILL_DTYPE)
+        reviewers, products, ratings, counts, review_times = self.aggregate_reviews(
+            reviewer_codes[records["reviewer"]],
+            product_codes[records["product"]],
+            records["rating"],
+            records["review_time"],
+            number_of_products
+        )
+
+        return (
+            reviewers.astype(np.int32),
+            products.astype(np.int32),
+            ratings,
+            counts.astype(np.int32),
+            review_times
+        )
+
+    def build_frame(
+        self, reviewer_ids, product_ids, encoded_reviewer_ids, encoded_product_ids,
+        ratings, rating_counts, review_times
+    ):
+        """Builds the aggregated frame from encoded columns and the ID categories."""
+        self.df = pd.DataFrame(
+            {
+                "reviewerID": pd.Categorical.from_codes(
+                    encoded_reviewer_ids, categories=reviewer_ids
+                ),
+                "productID": pd.Categorical.from_codes(
+                    encoded_product_ids, categories=product_ids
+                ),
+                "rating": ratings,
+                "ratingCount": rating_counts,
+                "unixReviewTime": review_times,
+                "encodedReviewerID": encoded_reviewer_ids,
+                "encodedProductID": encoded_product_ids
+            }
+        )
+
+    def load_data_chunked(self):
+        """Loads, encodes and aggregates the reviews out of core in bounded chunks."""
+        self.applied_deltas = [
+            path.name.split(".")[0] for path in self.get_applied_delta_paths()
+        ]
+        aggregated = []
+        with tempfile.TemporaryDirectory(dir=self.config.root_dir) as spill_dir:
+            partition_paths, reviewer_ids, product_ids = self.spill_partitions(
+                spill_dir
+            )
+            reviewer_ids, reviewer_ranks = ReviewColumns.sort_ids(reviewer_ids)
+            product_ids, product_ranks = ReviewColumns.sort_ids(product_ids)
+            self.reviewer_vocabulary, reviewer_codes = self.extend_saved_vocabulary(
+                "reviewer", reviewer_ids
+            )
+            self.product_vocabulary, product_codes = self.extend_saved_vocabulary(
+                "product", product_ids
+            )
+            for partition_path in partition_paths:
+                aggregated.append(
+                    self.aggregate_partition(
+                        partition_path,
+                        reviewer_codes[reviewer_ranks],
+                        product_codes[product_ranks],
+                        len(self.product_vocabulary)
+                    )
+                )
+
+        columns = [np.concatenate(column) for column in zip(*aggregated)]
+        order = np.lexsort((columns[1], columns[0]))
+        self.build_frame(
+            self.reviewer_vocabulary.ids,
+            self.product_vocabulary.ids,
+            *[column[order] for column in columns]
+        )
+
+        self.reviewer_encoder = self.build_label_encoder(self.reviewer_vocabulary)
+        self.product_encoder = self.build_label_encoder(self.product_vocabulary)
+
+    def update_data(self):
+        """Merges a delta file of new reviews into the existing preprocessed data."""
+        root_dir = Path(self.config.root_dir)
+        review_table = ReviewTable.open(root_dir / "preprocessed_data.bin")
+        delta_hash = get_file_hash(self.config.delta_path)
+        self.keep_delta(delta_hash)
+        self.applied_deltas = review_table.applied_deltas.tolist()
+        delta_paths = [self.config.delta_path]
+        if delta_hash in self.applied_deltas:
+            logger.info(f"Skip delta already merged into the table: {delta_hash}")
+            delta_paths = []
+        else:
+            self.applied_deltas.append(delta_hash)
+        delta = ReviewColumns.parse(delta_paths, self.config.chunk_size)
+
+        self.reviewer_vocabulary, reviewer_codes = Vocabulary.load(
+            root_dir / "reviewer_vocabulary.npz"
+        ).extend(delta.reviewer_ids)
+        self.product_vocabulary, product_codes = Vocabulary.load(
+            root_dir / "product_vocabulary.npz"
+        ).extend(delta.product_ids)
+        number_of_products = len(self.product_vocabulary)
+
+        (
+            delta_reviewers,
+            delta_products,
+            delta_ratings,
+            delta_counts,
+            delta_review_times
+        ) = self.aggregate_reviews(
+            reviewer_codes[delta.reviewer_codes],
+            product_codes[delta.product_codes],
+            delta.ratings,
+            delta.review_times,
+            number_of_products
+        )
+        delta_keys = delta_reviewers * number_of_products + delta_products
+
+        keys = (
+            review_table.encoded_reviewer_ids.astype(np.int64) * number_of_products
+            + review_table.encoded_product_ids
+        )
+        ratings = review_table.ratings.astype(np.float64)
+        review_times = np.array(review_table.review_times, dtype=np.int64)
+        rating_counts = np.ones(len(review_table), dtype=np.int64)
+        if review_table.rating_counts is not None:
+            rating_counts[:] = review_table.rating_counts
+
+        positions = np.searchsorted(keys, delta_keys)
+        existing = positions < len(keys)
+        existing[existing] = keys[positions[existing]] == delta_keys[existing]
+
+        updated = positions[existing]
+        total_counts = rating_counts[updated] + delta_counts[existing]
+        ratings[updated] = (
+            ratings[updated] * rating_counts[updated]
+            + delta_ratings[existing] * delta_counts[existing]
+        ) / total_counts
+        rating_counts[updated] = total_counts
+        review_times[updated] = np.maximum(
+            review_times[updated], delta_review_times[existing]
+        )
+
+        inserted = positions[~existing]
+        keys = np.insert(keys, inserted, delta_keys[~existing])
+        ratings = np.insert(ratings, inserted, delta_ratings[~existing])
+        rating_counts = np.insert(rating_counts, inserted, delta_counts[~existing])
+        review_times = np.insert(review_times, inserted, delta_review_times[~existing])
+
+        self.build_frame(
+            self.reviewer_vocabulary.ids,
+            self.product_vocabulary.ids,
+            keys // number_of_products,
+            keys % number_of_products,
+            ratings,
+            rating_counts,
+            review_times
+        )
+        self.reviewer_encoder = self.build_label_encoder(self.reviewer_vocabulary)
+        self.product_encoder = self.build_label_encoder(self.product_vocabulary)
+        logger.info(
+            f"Merge {len(delta)} new reviews: {int(existing.sum())} updated and "
+            f"{len(inserted)} new reviewer and product pairs"
         )
 
     def encode_labels(self):
-        """Encodes reviewer and product labels using LabelEncoder."""
-        self.reviewer_encoder = LabelEncoder()
-        self.df["encodedReviewerID"] = self.reviewer_encoder.fit_transform(
-            self.df["reviewerID"]
+        """Encodes reviewer and product labels, keeping the codes of saved IDs."""
+        reviewer_ids, reviewer_ranks = np.unique(
+            self.df["reviewerID"].to_numpy(dtype=np.str_), return_inverse=True
+        )
+        self.reviewer_vocabulary, reviewer_codes = self.extend_saved_vocabulary(
+            "reviewer", reviewer_ids
         )
+        self.df["encodedReviewerID"] = reviewer_codes[reviewer_ranks]
 
-        self.product_encoder = LabelEncoder()
-        self.df["encodedProductID"] = self.product_encoder.fit_transform(
-            self.df["productID"]
+        product_ids, product_ranks = np.unique(
+            self.df["productID"].to_numpy(dtype=np.str_), return_inverse=True
+        )
+        self.product_vocabulary, product_codes = self.extend_saved_vocabulary(
+            "product", product_ids
+        )
+        self.df["encodedProductID"] = product_codes[product_ranks]
+        self.df = self.df.sort_values(
+            ["encodedReviewerID", "encodedProductID"], ignore_index=True
         )
 
+        self.reviewer_encoder = self.build_label_encoder(self.reviewer_vocabulary)
+        self.product_encoder = self.build_label_encoder(self.product_vocabulary)
+
     def calculate_statistics(self):
         """Calculates statistics."""
-        self.number_of_reviewers = self.df["encodedReviewerID"].nunique()
-        self.number_of_products = self.df["encodedProductID"].nunique()
+        self.number_of_reviewers = len(self.reviewer_vocabulary)
+        self.number_of_products = len(self.product_vocabulary)
         self.min_rating = np.min(self.df["rating"])
         self.max_rating = np.max(self.df["rating"])
         self.save_params()
 
+    def build_popularity_index(self):
+        """Ranks products by Bayesian-average rating, optionally weighted by recency."""
+        products = self.df["encodedProductID"].to_numpy()
+        ratings = self.df["rating"].to_numpy(dtype=np.float64)
+        weights = np.ones(len(ratings))
+
+        if self.config.popularity_half_life_days is not None:
+            review_times = self.df["unixReviewTime"].to_numpy(dtype=np.float64)
+            age_in_days = (review_times.max() - review_times) / 86400
+            weights = 0.5 ** (age_in_days / self.config.popularity_half_life_days)
+
+        counts = np.bincount(products, minlength=self.number_of_products)
+        weighted_counts = np.bincount(
+            products, weights=weights, minlength=self.number_of_products
+        )
+        weighted_sums = np.bincount(
+            products, weights=weights * ratings, minlength=self.number_of_products
+        )
+
+        global_mean = weighted_sums.sum() / weighted_counts.sum()
+        prior_weight = self.config.popularity_prior_weight
+        if prior_weight is None:
+            prior_weight = weighted_counts.mean()
+
+        scores = (prior_weight * global_mean + weighted_sums) / (
+            prior_weight + weighted_counts
+        )
+        self.popularity_scores = scores.astype(np.float32)
+        self.popularity_counts = counts.astype(np.int32)
+        self.popularity_ranking = np.argsort(-scores, kind="stable").astype(np.int32)
+
     def prepare_data(self):
         """Prepares the features and targets for training and validation."""
         features = self.df[["encodedReviewerID", "encodedProductID"]]
         targets = self.df["rating"]
 
-        self.X_train, self.X_val, self.y_train, self.y_val = train_test_split(
-            features.values, targets.values, test_size=0.2, random_state=1
+        self.X_train, self.X_val, self.y_train, self.y_val = self.split_by_hash(
+            features.values, targets.values
         )
 
         self.X_train_lists = [self.X_train[:, 0], self.X_train[:, 1]]
@@ -65,6 +448,27 @@ class DataPreprocessor:
         )
         self.y_val_scaled = scale_targets(self.y_val, self.min_rating, self.max_rating)
 
+    def split_by_hash(self, features, targets, seed=1):
+        """Splits rows into training and validation by a hash of their encoded IDs."""
+        with np.errstate(over="ignore"):
+            hashes = (
+                features[:, 0].astype(np.uint64) << np.uint64(32)
+            ) | features[:, 1].astype(np.uint64)
+            hashes += np.uint64(seed) * np.uint64(0x9E3779B97F4A7C15)
+            hashes ^= hashes >> np.uint64(30)
+            hashes *= np.uint64(0xBF58476D1CE4E5B9)
+            hashes ^= hashes >> np.uint64(27)
+            hashes *= np.uint64(0x94D049BB133111EB)
+            hashes ^= hashes >> np.uint64(31)
+
+        is_validation = hashes % np.uint64(10000) < VALIDATION_FRACTION * 10000
+        return (
+            features[~is_validation],
+            features[is_validation],
+            targets[~is_validation],
+            targets[is_validation]
+        )
+
     def save_params(self):
         """Saves the parameters."""
         params_file_path = Path("params/params.yaml")
@@ -87,21 +491,48 @@ class DataPreprocessor:
         """Saves preprocessed variables and objects."""
         os.makedirs(self.config.root_dir, exist_ok=True)
 
-        self.df.to_csv(
-            os.path.join(self.config.root_dir, "preprocessed_data.csv"), index=False
+        ReviewTable.write(
+            os.path.join(self.config.root_dir, "preprocessed_data.bin"),
+            self.df,
+            self.reviewer_vocabulary.ids,
+            self.product_vocabulary.ids,
+            self.applied_deltas
         )
 
         file_data = {
             "reviewer_encoder.pkl": self.reviewer_encoder,
-            "product_encoder.pkl": self.product_encoder,
-            "X_train.pkl": self.X_train_lists,
-            "X_val.pkl": self.X_val_lists,
-            "y_train_scaled.pkl": self.y_train_scaled,
-            "y_val_scaled.pkl": self.y_val_scaled,
-            "val_reviewer_ids.pkl": self.val_reviewer_ids,
-            "val_product_ids.pkl": self.val_product_ids
+            "product_encoder.pkl": self.product_encoder
         }
 
         for filename, data in file_data.items():
-            with open(os.path.join(self.config.root_dir, filename), "wb") as f:
+            file_path = Path(self.config.root_dir) / filename
+            if data is None:
+                file_path.unlink(missing_ok=True)
+                continue
+            with open(file_path, "wb") as f:
                 pickle.dump(data, f)
+
+        ArrayStore(self.config.root_dir).save(
+            {
+                "X_train": np.asarray(self.X_train_lists, dtype=np.int32),
+                "X_val": np.asarray(self.X_val_lists, dtype=np.int32),
+                "y_train_scaled": self.y_train_scaled.astype(np.float32),
+                "y_val_scaled": self.y_val_scaled.astype(np.float32),
+                "val_reviewer_ids": self.val_reviewer_ids.astype(np.int32),
+                "val_product_ids": self.val_product_ids.astype(np.int32)
+            }
+        )
+
+        self.reviewer_vocabulary.save(
+            os.path.join(self.config.root_dir, "reviewer_vocabulary.npz")
+        )
+        self.product_vocabulary.save(
+            os.path.join(self.config.root_dir, "product_vocabulary.npz")
+        )
+
+        np.savez(
+            os.path.join(self.config.root_dir, "popularity_index.npz"),
+            ranking=self.popularity_ranking,
+            scores=self.popularity_scores,
+            counts=self.popularity_counts
+        )
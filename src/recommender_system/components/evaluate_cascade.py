@@ -0,0 +1,83 @@
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+
+from recommender_system.utils import unscale_targets
+
+
+class EvaluateCascade:
+    def __init__(self, config):
+        """Initialises the EvaluateCascade object with the given config."""
+        self.config = config
+
+    def calculate_dcg(self, relevance_scores, k):
+        """Calculates Discounted Cumulative Gain (DCG) at position k."""
+        relevance_scores = relevance_scores[:k]
+        positions = np.arange(2, len(relevance_scores) + 2)
+        dcg = np.sum(relevance_scores / np.log2(positions))
+        return dcg
+
+    def rank_full(self, engine, encoded_reviewer_ids, k):
+        """Ranks every unrated product and times the full scoring path."""
+        rankings = []
+        start_time = time.perf_counter()
+        for encoded_reviewer_id in encoded_reviewer_ids:
+            encoded_products, _ = engine.rank_products(encoded_reviewer_id, k)
+            rankings.append(encoded_products)
+        elapsed = time.perf_counter() - start_time
+
+        return rankings, 1000 * elapsed / len(encoded_reviewer_ids)
+
+    def evaluate(self, engine, k=10, sample_size=500, seed=42):
+        """Compares cascade and full scoring recommendations per candidate size."""
+        rng = np.random.default_rng(seed)
+        number_of_reviewers = len(engine.rated_products_indptr) - 1
+        encoded_reviewer_ids = rng.choice(
+            number_of_reviewers, min(sample_size, number_of_reviewers), replace=False
+        )
+
+        full_rankings, full_latency = self.rank_full(engine, encoded_reviewer_ids, k)
+        full_ratings = [
+            unscale_targets(
+                engine.score_reviewers([encoded_reviewer_id])[0],
+                engine.min_rating,
+                engine.max_rating
+            )
+            for encoded_reviewer_id in encoded_reviewer_ids
+        ]
+
+        results = {"k": k, "full_latency_ms": full_latency, "cascade": []}
+        for num_candidates in self.config.candidate_sizes:
+            overlaps = []
+            ndcgs = []
+            start_time = time.perf_counter()
+            cascade_rankings = [
+                engine.rank_products(encoded_reviewer_id, k, num_candidates)[0]
+                for encoded_reviewer_id in encoded_reviewer_ids
+            ]
+            elapsed = time.perf_counter() - start_time
+
+            for full, cascade, ratings in zip(
+                full_rankings, cascade_rankings, full_ratings
+            ):
+                overlaps.append(len(np.intersect1d(full, cascade)) / max(len(full), 1))
+                dcg_max = self.calculate_dcg(ratings[full], k)
+                dcg = self.calculate_dcg(ratings[cascade], k)
+                ndcgs.append(dcg / dcg_max if dcg_max != 0 else 0)
+
+            results["cascade"].append(
+                {
+                    "num_candidates": int(num_candidates),
+                    f"overlap@{k}": float(np.mean(overlaps)),
+                    "ndcg_delta": float(1 - np.mean(ndcgs)),
+                    "latency_ms": 1000 * elapsed / len(encoded_reviewer_ids)
+                }
+            )
+
+        results_filepath = Path(self.config.root_dir) / "cascade_results.json"
+        with open(results_filepath, "w") as f:
+            json.dump(results, f, indent=4)
+
+        return results
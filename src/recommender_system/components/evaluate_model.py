@@ -1,5 +1,4 @@
 import json
-import pickle
 from pathlib import Path
 
 import numpy as np
@@ -8,6 +7,7 @@ from sklearn.metrics import (mean_absolute_error,
                              mean_absolute_percentage_error,
                              mean_squared_error, r2_score)
 
+from recommender_system.components.array_store import ArrayStore
 from recommender_system.utils import unscale_targets
 
 
@@ -15,42 +15,34 @@ class EvaluateModel:
     def __init__(self, config):
         """Initialises the EvaluateModel object with the given config."""
         self.config = config
+        self.data = None
 
     def load_trained_model(self):
         """Loads the trained model."""
         return tf.keras.models.load_model(self.config.trained_model_path)
 
     def load_data(self):
-        """Loads and returns the required data for evaluation."""
-        data_path = Path(self.config.data_path)
-        pickle_files = [
-            "X_val.pkl",
-            "y_val_scaled.pkl",
-            "val_reviewer_ids.pkl",
-            "val_product_ids.pkl"
-        ]
-
-        loaded_data = {}
-        for file_name in pickle_files:
-            file_path = data_path / file_name
-            with open(file_path, "rb") as f:
-                loaded_data[file_name] = pickle.load(f)
-
-        X_val = loaded_data["X_val.pkl"]
-        y_val_scaled = loaded_data["y_val_scaled.pkl"]
+        """Loads the required data for evaluation once and returns it."""
+        if self.data is not None:
+            return self.data
+
+        array_store = ArrayStore(self.config.data_path)
+        X_val = list(array_store.load("X_val"))
+        y_val_scaled = array_store.load("y_val_scaled")
         self.y_val_original = unscale_targets(
             y_val_scaled, self.config.min_rating, self.config.max_rating
         )
-        self.val_reviewer_ids = loaded_data["val_reviewer_ids.pkl"]
-        self.val_product_ids = loaded_data["val_product_ids.pkl"]
+        self.val_reviewer_ids = array_store.load("val_reviewer_ids")
+        self.val_product_ids = array_store.load("val_product_ids")
 
-        return (
+        self.data = (
             X_val,
             y_val_scaled,
             self.y_val_original,
             self.val_reviewer_ids,
             self.val_product_ids
         )
+        return self.data
 
     def generate_predictions(self):
         """Generates predictions using the trained model."""
@@ -58,16 +50,20 @@ class EvaluateModel:
         X_val, _, _, _, _ = self.load_data()
         self.y_hat = model.predict(X_val, verbose=self.config.verbose)
 
+    def calculate_metrics(self, y, y_hat):
+        """Calculates regression metrics between ground truth y and predicted y_hat."""
+        return {
+            "R2": r2_score(y, y_hat),
+            "MAE": mean_absolute_error(y, y_hat),
+            "MAPE": mean_absolute_percentage_error(y, y_hat),
+            "MSE": mean_squared_error(y, y_hat),
+            "RMSE": np.sqrt(mean_squared_error(y, y_hat))
+        }
+
     def evaluate(self):
         """Calculates evaluation metrics between ground truth y and predicted y_hat."""
         _, self.y, _, _, _ = self.load_data()
-        evaluation_results = {
-            "R2": r2_score(self.y, self.y_hat),
-            "MAE": mean_absolute_error(self.y, self.y_hat),
-            "MAPE": mean_absolute_percentage_error(self.y, self.y_hat),
-            "MSE": mean_squared_error(self.y, self.y_hat),
-            "RMSE": np.sqrt(mean_squared_error(self.y, self.y_hat))
-        }
+        evaluation_results = self.calculate_metrics(self.y, self.y_hat)
 
         results_filepath = Path(self.config.root_dir) / "evaluation_results.json"
         with open(results_filepath, "w") as f:
@@ -92,26 +88,26 @@ class EvaluateModel:
 
     def ranking_evaluation(self, k=10):
         """Performs ranking evaluation using NDCG."""
+        ndcg = self.calculate_mean_ndcg(self.y_hat, k)
+
+        results_filepath = Path(self.config.root_dir) / "ndcg_result.json"
+        with open(results_filepath, "w") as f:
+            json.dump({"NDCG": ndcg}, f)
+
+        return ndcg
+
+    def calculate_mean_ndcg(self, y_hat, k=10):
+        """Calculates the mean NDCG at position k of predictions over reviewers."""
+        y_hat = np.asarray(y_hat).ravel()
         ndcgs = []
 
         for reviewer in np.unique(self.val_reviewer_ids):
-            target_val_product_ids = self.val_product_ids[
-                self.val_reviewer_ids == reviewer
-            ]
-            target_val_ratings = self.y_val_original[self.val_reviewer_ids == reviewer]
+            reviewer_mask = self.val_reviewer_ids == reviewer
+            target_val_ratings = self.y_val_original[reviewer_mask]
             ndcg = self.calculate_ndcg(
-                target_val_ratings[
-                    np.argsort(-self.y_hat[self.val_reviewer_ids == reviewer])
-                ],
-                k=k
+                target_val_ratings[np.argsort(-y_hat[reviewer_mask])], k=k
             )
             ndcgs.append(ndcg)
 
-        ndcg = np.mean(ndcgs)
-
-        results_filepath = Path(self.config.root_dir) / "ndcg_result.json"
-        with open(results_filepath, "w") as f:
-            json.dump({"NDCG": ndcg}, f)
-
-        return ndcg
+        return np.mean(ndcgs)
         
\ No newline at end of file
@@ -0,0 +1,187 @@
+import json
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+import tensorflow as tf
+from keras.layers import Dense, Embedding
+
+from recommender_system.components.array_store import ArrayStore
+from recommender_system.components.numpy_scorer import NumpyScorer
+from recommender_system.components.quantization import QuantizedTable
+from recommender_system.components.review_table import ReviewTable
+from recommender_system.components.serving_bundle import ServingBundle
+from recommender_system.components.serving_version import ServingVersion
+from recommender_system.components.vocabulary import Vocabulary
+from recommender_system.logging import logger
+
+
+class ModelExporter:
+    def __init__(self, config):
+        """Initialises the ModelExporter object with the given config."""
+        self.config = config
+
+    def load_trained_model(self):
+        """Loads the trained model."""
+        return tf.keras.models.load_model(self.config.trained_model_path)
+
+    def extract_weights(self, model):
+        """Extracts the embedding tables and dense weights from the trained model."""
+        reviewer_input, product_input = model.inputs
+        embeddings = {}
+        for layer in model.layers:
+            if isinstance(layer, Embedding):
+                embeddings[layer.input.name] = layer.get_weights()[0]
+
+        hidden_1, hidden_2, output = [
+            layer for layer in model.layers if isinstance(layer, Dense)
+        ]
+
+        weights = {
+            "reviewer_embeddings": embeddings[reviewer_input.name],
+            "product_embeddings": embeddings[product_input.name],
+            "hidden_1_kernel": hidden_1.get_weights()[0],
+            "hidden_1_bias": hidden_1.get_weights()[1],
+            "hidden_2_kernel": hidden_2.get_weights()[0],
+            "hidden_2_bias": hidden_2.get_weights()[1],
+            "output_kernel": output.get_weights()[0],
+            "output_bias": output.get_weights()[1]
+        }
+
+        return {
+            name: np.asarray(array, dtype=np.float32) for name, array in weights.items()
+        }
+
+    def export_weights(self):
+        """Exports the trained model weights to a flat array file."""
+        self.model = self.load_trained_model()
+        self.weights = self.extract_weights(self.model)
+        np.savez(self.config.model_weights_path, **self.weights)
+        logger.info(f"Export model weights to: {self.config.model_weights_path}")
+
+    def get_weights_path(self, precision):
+        """Returns the path of the exported weights at the given precision."""
+        return {
+            "float32": self.config.model_weights_path,
+            "float16": self.config.float16_weights_path,
+            "int8": self.config.int8_weights_path
+        }[precision]
+
+    def export_quantized_weights(self):
+        """Exports float16 and per-row scaled int8 versions of the model weights."""
+        for precision in ("float16", "int8"):
+            weights_path = self.get_weights_path(precision)
+            np.savez(
+                weights_path, **QuantizedTable.quantize_weights(self.weights, precision)
+            )
+            logger.info(f"Export {precision} model weights to: {weights_path}")
+
+    def load_validation_data(self):
+        """Loads the validation features."""
+        return list(ArrayStore(self.config.data_path).load("X_val"))
+
+    def verify_parity(self, tolerance=1e-5):
+        """Checks that the NumPy scorer reproduces the trained model's predictions."""
+        X_val = self.load_validation_data()
+        scorer = NumpyScorer.from_file(self.config.model_weights_path)
+
+        y_hat_model = self.model.predict(X_val, verbose=self.config.verbose)
+        y_hat_numpy = scorer.predict(X_val[0], X_val[1])
+        max_difference = float(np.max(np.abs(y_hat_model - y_hat_numpy)))
+
+        logger.info(f"Max difference between Keras and NumPy scores: {max_difference}")
+        if max_difference > tolerance:
+            raise ValueError(
+                f"NumPy scorer differs from the trained model by {max_difference}"
+            )
+
+        return max_difference
+
+    def export_serving_bundle(self):
+        """Exports the serving weights and lookup tables as one aligned bundle."""
+        scorer = NumpyScorer(self.weights)
+        reviewer_vocabulary = Vocabulary.load(
+            self.config.data_path / "reviewer_vocabulary.npz"
+        )
+        product_vocabulary = Vocabulary.load(
+            self.config.data_path / "product_vocabulary.npz"
+        )
+        review_table = ReviewTable.open(self.config.data_path / "preprocessed_data.bin")
+
+        weights = dict(self.weights)
+        weights["product_hidden_1"] = scorer.product_hidden_1.astype(np.float32)
+
+        arrays = QuantizedTable.quantize_weights(
+            weights, self.config.weights_precision
+        )
+        arrays["reviewer_ids"] = reviewer_vocabulary.ids
+        arrays["product_ids"] = product_vocabulary.ids
+        arrays["rated_products_indptr"] = review_table.indptr
+        arrays["rated_products_indices"] = review_table.encoded_product_ids
+
+        ServingBundle.write(self.config.serving_bundle_path, arrays)
+        logger.info(f"Export serving bundle to: {self.config.serving_bundle_path}")
+
+    def record_serving_version(self):
+        """Records the hashes of the exported serving artifacts as the new version."""
+        version = ServingVersion(self.config.serving_version_path).update(
+            [
+                self.config.trained_model_path,
+                self.config.model_weights_path,
+                self.config.float16_weights_path,
+                self.config.int8_weights_path,
+                self.config.serving_bundle_path
+            ]
+        )
+        logger.info(f"Record serving version: {version}")
+
+    def measure_latency(self, scorer, encoded_reviewer_ids):
+        """Returns the mean milliseconds taken to score every product per reviewer."""
+        start_time = time.perf_counter()
+        for encoded_reviewer_id in encoded_reviewer_ids:
+            scorer.score(encoded_reviewer_id)
+        elapsed = time.perf_counter() - start_time
+
+        return 1000 * elapsed / len(encoded_reviewer_ids)
+
+    def evaluate_quantization(self, evaluate_model, sample_size=200, seed=42):
+        """Compares size, latency, RMSE and NDCG of quantised and float32 weights."""
+        X_val, y_val_scaled, _, _, _ = evaluate_model.load_data()
+        rng = np.random.default_rng(seed)
+        number_of_reviewers = len(self.weights["reviewer_embeddings"])
+        encoded_reviewer_ids = rng.choice(
+            number_of_reviewers, min(sample_size, number_of_reviewers), replace=False
+        )
+
+        results = {}
+        for precision in ("float32", "float16", "int8"):
+            weights_path = self.get_weights_path(precision)
+            scorer = NumpyScorer.from_file(weights_path)
+            y_hat = scorer.predict(X_val[0], X_val[1])
+            metrics = evaluate_model.calculate_metrics(y_val_scaled, y_hat)
+
+            results[precision] = {
+                "size_bytes": os.path.getsize(weights_path),
+                "latency_ms": self.measure_latency(scorer, encoded_reviewer_ids),
+                "RMSE": float(metrics["RMSE"]),
+                "NDCG": float(evaluate_model.calculate_mean_ndcg(y_hat))
+            }
+
+        for precision in ("float16", "int8"):
+            results[precision]["size_ratio"] = (
+                results[precision]["size_bytes"] / results["float32"]["size_bytes"]
+            )
+            results[precision]["rmse_delta"] = (
+                results[precision]["RMSE"] - results["float32"]["RMSE"]
+            )
+            results[precision]["ndcg_delta"] = (
+                results[precision]["NDCG"] - results["float32"]["NDCG"]
+            )
+
+        results_filepath = Path(self.config.root_dir) / "quantization_results.json"
+        with open(results_filepath, "w") as f:
+            json.dump(results, f, indent=4)
+
+        logger.info(f"Quantisation results: {results}")
+        return results
@@ -0,0 +1,103 @@
+import asyncio
+
+
+class MicroBatcher:
+    def __init__(self, batch_function, max_batch_size, max_wait_ms):
+        """Initialises the MicroBatcher object with a batch recommendation function."""
+        self.batch_function = batch_function
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.queue = None
+        self.task = None
+        self.batches = 0
+        self.requests = 0
+
+    async def start(self):
+        """Starts collecting queued requests into batches."""
+        self.queue = asyncio.Queue()
+        self.task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        """Stops the batching loop."""
+        self.task.cancel()
+        try:
+            await self.task
+        except asyncio.CancelledError:
+            pass
+
+    async def submit(self, reviewer_id, num_items):
+        """Queues a recommendation request and waits for its result."""
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((reviewer_id, num_items, future))
+        return await future
+
+    async def collect_batch(self):
+        """Collects queued requests until the batch is full or the wait runs out."""
+        loop = asyncio.get_running_loop()
+        batch = [await self.queue.get()]
+        deadline = loop.time() + self.max_wait_ms / 1000
+
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def process_batch(self, batch):
+        """Scores a batch of requests in one call and fans the results out in order."""
+        reviewer_ids = [reviewer_id for reviewer_id, _, _ in batch]
+        num_items = max(num_items for _, num_items, _ in batch)
+
+        try:
+            recommendations = await asyncio.get_running_loop().run_in_executor(
+                None, self.batch_function, reviewer_ids, num_items
+            )
+            if len(recommendations) != len(batch):
+                raise ValueError(
+                    f"Batch function returned {len(recommendations)} results "
+                    f"for {len(batch)} requests"
+                )
+        except Exception as e:
+            self.fail_batch(batch, e)
+            return
+
+        self.batches += 1
+        self.requests += len(batch)
+        for (_, num_items, future), reviewer_recommendations in zip(
+            batch, recommendations
+        ):
+            if future.done():
+                continue
+            try:
+                future.set_result(reviewer_recommendations.head(num_items))
+            except Exception as e:
+                future.set_exception(e)
+
+    @staticmethod
+    def fail_batch(batch, exception):
+        """Fails every request of a batch that is still waiting for its result."""
+        for _, _, future in batch:
+            if not future.done():
+                future.set_exception(exception)
+
+    async def run(self):
+        """Collects and processes batches until cancelled, surviving failed batches."""
+        while True:
+            batch = await self.collect_batch()
+            try:
+                await self.process_batch(batch)
+            except Exception as e:
+                self.fail_batch(batch, e)
+
+    def stats(self):
+        """Returns the number of batches and requests processed so far."""
+        return {
+            "batches": self.batches,
+            "requests": self.requests,
+            "mean_batch_size": self.requests / self.batches if self.batches else 0
+        }
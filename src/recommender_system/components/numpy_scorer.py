@@ -0,0 +1,117 @@
+import numpy as np
+
+from recommender_system.components.quantization import QuantizedTable
+
+
+class NumpyScorer:
+    def __init__(self, weights):
+        """Initialises the NumpyScorer object with the exported model weights."""
+        self.reviewer_embeddings = QuantizedTable.from_weights(
+            weights, "reviewer_embeddings"
+        )
+        self.product_embeddings = QuantizedTable.from_weights(
+            weights, "product_embeddings"
+        )
+        self.hidden_1_kernel = QuantizedTable.dequantize_weight(
+            weights, "hidden_1_kernel"
+        )
+        self.hidden_1_bias = QuantizedTable.dequantize_weight(weights, "hidden_1_bias")
+        self.hidden_2_kernel = QuantizedTable.dequantize_weight(
+            weights, "hidden_2_kernel"
+        )
+        self.hidden_2_bias = QuantizedTable.dequantize_weight(weights, "hidden_2_bias")
+        self.output_kernel = QuantizedTable.dequantize_weight(weights, "output_kernel")
+        self.output_bias = QuantizedTable.dequantize_weight(weights, "output_bias")
+
+        number_of_dimensions = self.reviewer_embeddings.shape[1]
+        self.hidden_1_reviewer_kernel = self.hidden_1_kernel[:number_of_dimensions]
+        self.hidden_1_product_kernel = self.hidden_1_kernel[number_of_dimensions:]
+        self.output_mf_kernel = self.output_kernel[:number_of_dimensions, 0]
+        self.output_hidden_kernel = self.output_kernel[number_of_dimensions:, 0]
+
+        if "product_hidden_1" in weights:
+            self.product_hidden_1 = QuantizedTable.dequantize_weight(
+                weights, "product_hidden_1"
+            )
+        else:
+            self.product_hidden_1 = self.precompute_product_hidden_1()
+
+    def precompute_product_hidden_1(self):
+        """Precomputes the product half of the first hidden layer for every product."""
+        return (
+            self.product_embeddings @ self.hidden_1_product_kernel + self.hidden_1_bias
+        )
+
+    @classmethod
+    def from_file(cls, weights_path):
+        """Creates a NumpyScorer from a weights file written by ModelExporter."""
+        with np.load(weights_path) as weights:
+            return cls({name: weights[name] for name in weights.files})
+
+    @staticmethod
+    def relu(x):
+        """Applies the rectified linear activation."""
+        return np.maximum(x, 0)
+
+    @staticmethod
+    def sigmoid(x):
+        """Applies the logistic sigmoid activation."""
+        return 1 / (1 + np.exp(-x))
+
+    def score(self, encoded_reviewer_id, encoded_product_ids=None):
+        """Returns scaled predicted ratings of one reviewer for the given products."""
+        reviewer_embedding = self.reviewer_embeddings[encoded_reviewer_id]
+        product_embeddings = self.product_embeddings
+        product_hidden_1 = self.product_hidden_1
+
+        if encoded_product_ids is not None:
+            product_embeddings = product_embeddings[encoded_product_ids]
+            product_hidden_1 = product_hidden_1[encoded_product_ids]
+
+        hidden_1 = self.relu(
+            product_hidden_1 + reviewer_embedding @ self.hidden_1_reviewer_kernel
+        )
+        hidden_2 = self.relu(hidden_1 @ self.hidden_2_kernel + self.hidden_2_bias)
+        logits = (
+            product_embeddings @ (reviewer_embedding * self.output_mf_kernel)
+            + hidden_2 @ self.output_hidden_kernel
+            + self.output_bias[0]
+        )
+
+        return self.sigmoid(logits)
+
+    def score_many(self, encoded_reviewer_ids):
+        """Returns scaled predicted ratings of several reviewers for every product."""
+        reviewer_embeddings = self.reviewer_embeddings[encoded_reviewer_ids]
+        mf_queries = reviewer_embeddings * self.output_mf_kernel
+
+        hidden_1 = self.relu(
+            self.product_hidden_1[np.newaxis, :, :]
+            + (reviewer_embeddings @ self.hidden_1_reviewer_kernel)[:, np.newaxis, :]
+        )
+        hidden_2 = self.relu(hidden_1 @ self.hidden_2_kernel + self.hidden_2_bias)
+        logits = (
+            (self.product_embeddings @ mf_queries.T).T
+            + hidden_2 @ self.output_hidden_kernel
+            + self.output_bias[0]
+        )
+
+        return self.sigmoid(logits)
+
+    def predict(self, encoded_reviewer_ids, encoded_product_ids):
+        """Returns scaled predicted ratings for paired reviewer and product IDs."""
+        reviewer_embeddings = self.reviewer_embeddings[encoded_reviewer_ids]
+        product_embeddings = self.product_embeddings[encoded_product_ids]
+
+        hidden_1 = self.relu(
+            self.product_hidden_1[encoded_product_ids]
+            + reviewer_embeddings @ self.hidden_1_reviewer_kernel
+        )
+        hidden_2 = self.relu(hidden_1 @ self.hidden_2_kernel + self.hidden_2_bias)
+        logits = (
+            (reviewer_embeddings * product_embeddings) @ self.output_mf_kernel
+            + hidden_2 @ self.output_hidden_kernel
+            + self.output_bias[0]
+        )
+
+        return self.sigmoid(logits).reshape(-1, 1)
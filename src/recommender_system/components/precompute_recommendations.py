@@ -0,0 +1,61 @@
+import numpy as np
+
+from recommender_system.components.serving_version import ServingVersion
+from recommender_system.logging import logger
+from recommender_system.utils import atomic_write, unscale_targets
+
+
+class RecommendationPrecomputer:
+    def __init__(self, config):
+        """Initialises the RecommendationPrecomputer object with the given config."""
+        self.config = config
+
+    def precompute(self, engine):
+        """Writes the top-N tables of every reviewer, swapping them in when complete."""
+        number_of_reviewers = len(engine.rated_products_indptr) - 1
+        top_n = min(self.config.top_n, engine.number_of_products)
+        shape = (number_of_reviewers, top_n)
+
+        products_writer = atomic_write(self.config.top_n_products_path)
+        ratings_writer = atomic_write(self.config.top_n_ratings_path)
+        with products_writer as products_path, ratings_writer as ratings_path:
+            top_n_products = np.lib.format.open_memmap(
+                products_path, mode="w+", dtype=np.int32, shape=shape
+            )
+            top_n_ratings = np.lib.format.open_memmap(
+                ratings_path, mode="w+", dtype=np.float32, shape=shape
+            )
+            self.fill_tables(engine, top_n_products, top_n_ratings)
+            top_n_products.flush()
+            top_n_ratings.flush()
+            del top_n_products, top_n_ratings
+
+        logger.info(
+            f"Precompute top-{top_n} recommendations at: {self.config.root_dir}"
+        )
+
+    def fill_tables(self, engine, top_n_products, top_n_ratings):
+        """Fills the top-N tables tile by tile with every reviewer's best products."""
+        number_of_reviewers, top_n = top_n_products.shape
+        for start in range(0, number_of_reviewers, engine.config.tile_size):
+            end = min(start + engine.config.tile_size, number_of_reviewers)
+            tile = np.arange(start, end)
+            scores = engine.score_reviewers(tile)
+            engine.mask_rated_products(tile, scores)
+            top_items = engine.select_top_items(scores, top_n)
+            top_scores = np.take_along_axis(scores, top_items, axis=1)
+            unrated = np.isfinite(top_scores)
+
+            top_n_products[start:end] = np.where(unrated, top_items, -1)
+            top_n_ratings[start:end] = np.where(
+                unrated,
+                unscale_targets(top_scores, engine.min_rating, engine.max_rating),
+                np.nan
+            )
+
+    def record_serving_version(self):
+        """Records the hashes of the new top-N tables as the new serving version."""
+        version = ServingVersion(self.config.serving_version_path).update(
+            [self.config.top_n_products_path, self.config.top_n_ratings_path]
+        )
+        logger.info(f"Record serving version: {version}")
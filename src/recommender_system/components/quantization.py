@@ -0,0 +1,89 @@
+import numpy as np
+
+PRECISIONS = ("float32", "float16", "int8")
+SCALE_SUFFIX = "_scale"
+
+
+class QuantizedTable:
+    def __init__(self, values, scales):
+        """Initialises the QuantizedTable object with int8 rows and their scales."""
+        self.values = values
+        self.scales = scales
+
+    def __len__(self):
+        """Returns the number of rows in the table."""
+        return len(self.values)
+
+    @property
+    def shape(self):
+        """Returns the shape of the table."""
+        return self.values.shape
+
+    @property
+    def nbytes(self):
+        """Returns the memory used by the rows and their scales in bytes."""
+        return self.values.nbytes + self.scales.nbytes
+
+    @classmethod
+    def quantize(cls, array):
+        """Quantises each row of a float array to int8 with a symmetric scale."""
+        array = np.asarray(array, dtype=np.float32)
+        scales = np.max(np.abs(array), axis=1) / 127
+        scales[scales == 0] = 1
+        values = np.clip(np.rint(array / scales[:, np.newaxis]), -127, 127)
+        return cls(values.astype(np.int8), scales.astype(np.float32))
+
+    @classmethod
+    def from_weights(cls, weights, name):
+        """Returns a weight as a QuantizedTable if it was stored as int8."""
+        if name + SCALE_SUFFIX in weights:
+            return cls(weights[name], weights[name + SCALE_SUFFIX])
+
+        return weights[name]
+
+    @classmethod
+    def dequantize_weight(cls, weights, name):
+        """Returns a weight as a float32 array whatever precision it was stored in."""
+        weight = cls.from_weights(weights, name)
+        if isinstance(weight, cls):
+            return weight.dequantize()
+
+        return np.asarray(weight, dtype=np.float32)
+
+    @staticmethod
+    def quantize_weights(weights, precision):
+        """Returns the weights at the given precision, with row scales for int8."""
+        if precision not in PRECISIONS:
+            raise ValueError(f"Unknown weights precision: {precision}")
+
+        quantized_weights = {}
+        for name, array in weights.items():
+            if precision == "float16":
+                quantized_weights[name] = np.asarray(array, dtype=np.float16)
+            elif precision == "int8" and np.ndim(array) == 2:
+                table = QuantizedTable.quantize(array)
+                quantized_weights[name] = table.values
+                quantized_weights[name + SCALE_SUFFIX] = table.scales
+            else:
+                quantized_weights[name] = np.asarray(array, dtype=np.float32)
+
+        return quantized_weights
+
+    def __getitem__(self, index):
+        """Returns the selected rows dequantised to float32."""
+        return (
+            self.values[index].astype(np.float32)
+            * self.scales[index][..., np.newaxis]
+        )
+
+    def __matmul__(self, other):
+        """Multiplies the int8 rows by a matrix or vector and rescales the result."""
+        product = self.values @ np.asarray(other, dtype=np.float32)
+        if product.ndim == 1:
+            return product * self.scales
+
+        return product * self.scales[:, np.newaxis]
+
+    def dequantize(self):
+        """Returns the whole table dequantised to float32."""
+        return self[:]
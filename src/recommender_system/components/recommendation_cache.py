@@ -0,0 +1,84 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class RecommendationCache:
+    def __init__(self, max_bytes, ttl_seconds=None):
+        """Initialises the RecommendationCache object with a memory cap and TTL."""
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def estimate_size(recommendations):
+        """Estimates the memory used by a recommendations table in bytes."""
+        return int(recommendations.memory_usage(deep=True).sum())
+
+    def remove(self, key):
+        """Removes an entry from the cache."""
+        _, size, _ = self._entries.pop(key)
+        self.size_bytes -= size
+
+    def get(self, key):
+        """Returns a copy of the cached recommendations for a key, if present."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            recommendations, _, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                self.remove(key)
+                self.misses += 1
+                self.evictions += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return recommendations.copy()
+
+    def put(self, key, recommendations):
+        """Stores recommendations for a key, evicting least recently used entries."""
+        size = self.estimate_size(recommendations)
+        if size > self.max_bytes:
+            return
+
+        expires_at = None
+        if self.ttl_seconds is not None:
+            expires_at = time.monotonic() + self.ttl_seconds
+
+        with self._lock:
+            if key in self._entries:
+                self.remove(key)
+
+            self._entries[key] = (recommendations.copy(), size, expires_at)
+            self.size_bytes += size
+
+            while self.size_bytes > self.max_bytes:
+                self.remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self):
+        """Removes every entry from the cache."""
+        with self._lock:
+            self._entries.clear()
+            self.size_bytes = 0
+
+    def stats(self):
+        """Returns the cache counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "size_bytes": self.size_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions
+            }
@@ -0,0 +1,208 @@
+import gzip
+import json
+import re
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from recommender_system.components.vocabulary import Vocabulary
+from recommender_system.utils import load_json, save_json
+
+ID_PATTERN = rb'[{,]\s*"%s":\s*"([^"\\]*)"'
+NUMBER_PATTERN = rb'[{,]\s*"%s":\s*(-?[0-9.eE+-]+)'
+REVIEWER_PATTERN = re.compile(ID_PATTERN % b"reviewerID")
+PRODUCT_PATTERN = re.compile(ID_PATTERN % b"asin")
+RATING_PATTERN = re.compile(NUMBER_PATTERN % b"overall")
+REVIEW_TIME_PATTERN = re.compile(NUMBER_PATTERN % b"unixReviewTime")
+
+
+class ReviewColumns:
+    def __init__(
+        self, reviewer_codes, product_codes, ratings, review_times, reviewer_ids,
+        product_ids
+    ):
+        """Initialises the ReviewColumns object with typed per-review columns."""
+        self.reviewer_codes = reviewer_codes
+        self.product_codes = product_codes
+        self.ratings = ratings
+        self.review_times = review_times
+        self.reviewer_ids = reviewer_ids
+        self.product_ids = product_ids
+
+    def __len__(self):
+        """Returns the number of reviews."""
+        return len(self.ratings)
+
+    @staticmethod
+    def open_source(data_path):
+        """Opens a JSON lines file for binary reading, decompressing it if gzipped."""
+        if Path(data_path).suffix == ".gz":
+            return gzip.open(data_path, "rb")
+
+        return open(data_path, "rb")
+
+    @staticmethod
+    def extract_fields(line):
+        """Extracts the reviewer, product, rating and time of one review line."""
+        reviewer = REVIEWER_PATTERN.search(line)
+        product = PRODUCT_PATTERN.search(line)
+        rating = RATING_PATTERN.search(line)
+        review_time = REVIEW_TIME_PATTERN.search(line)
+
+        if reviewer and product and rating and review_time:
+            return (
+                reviewer.group(1),
+                product.group(1),
+                float(rating.group(1)),
+                int(review_time.group(1))
+            )
+
+        review = json.loads(line)
+        return (
+            review["reviewerID"].encode("utf-8"),
+            review["asin"].encode("utf-8"),
+            float(review["overall"]),
+            int(review["unixReviewTime"])
+        )
+
+    @classmethod
+    def iter_lines(cls, data_paths):
+        """Yields the non-empty lines of each JSON lines source in turn."""
+        for data_path in data_paths:
+            with cls.open_source(data_path) as source:
+                for line in source:
+                    if line.strip():
+                        yield line
+
+    @staticmethod
+    def take_chunk(chunk):
+        """Returns the parsed chunk as typed arrays and empties it for the next one."""
+        arrays = (
+            np.array(chunk["reviewer"], dtype=np.int32),
+            np.array(chunk["product"], dtype=np.int32),
+            np.array(chunk["rating"], dtype=np.float32),
+            np.array(chunk["review_time"], dtype=np.int64)
+        )
+        for values in chunk.values():
+            values.clear()
+
+        return arrays
+
+    @staticmethod
+    def index_ids(id_index):
+        """Returns the IDs of a first-seen index in code order."""
+        return np.array([id_.decode("utf-8") for id_ in id_index], dtype=np.str_)
+
+    @classmethod
+    def iter_parsed_chunks(cls, data_paths, chunk_size, reviewer_index, product_index):
+        """Parses the review lines of the sources into chunks of typed columns."""
+        chunk = {"reviewer": [], "product": [], "rating": [], "review_time": []}
+
+        for line in cls.iter_lines(data_paths):
+            reviewer_id, product_id, rating, review_time = cls.extract_fields(line)
+            chunk["reviewer"].append(
+                reviewer_index.setdefault(reviewer_id, len(reviewer_index))
+            )
+            chunk["product"].append(
+                product_index.setdefault(product_id, len(product_index))
+            )
+            chunk["rating"].append(rating)
+            chunk["review_time"].append(review_time)
+
+            if len(chunk["rating"]) >= chunk_size:
+                yield cls.take_chunk(chunk)
+
+        yield cls.take_chunk(chunk)
+
+    @classmethod
+    def parse(cls, data_paths, chunk_size):
+        """Parses only the needed fields of each review line into typed columns."""
+        reviewer_index = {}
+        product_index = {}
+        chunks = list(
+            cls.iter_parsed_chunks(
+                data_paths, chunk_size, reviewer_index, product_index
+            )
+        )
+
+        return cls(
+            *[np.concatenate(columns) for columns in zip(*chunks)],
+            cls.index_ids(reviewer_index),
+            cls.index_ids(product_index)
+        )
+
+    def iter_chunks(self, chunk_size):
+        """Yields the typed columns in slices of at most chunk_size reviews."""
+        for start in range(0, len(self), chunk_size):
+            chunk = slice(start, start + chunk_size)
+            yield (
+                self.reviewer_codes[chunk],
+                self.product_codes[chunk],
+                self.ratings[chunk],
+                self.review_times[chunk]
+            )
+
+    def save(self, columns_dir, source_hash):
+        """Saves each column as a .npy file with a manifest naming the source hash."""
+        columns_dir = Path(columns_dir)
+        columns_dir.mkdir(parents=True, exist_ok=True)
+
+        np.save(columns_dir / "reviewer_codes.npy", self.reviewer_codes)
+        np.save(columns_dir / "product_codes.npy", self.product_codes)
+        np.save(columns_dir / "ratings.npy", self.ratings)
+        np.save(columns_dir / "review_times.npy", self.review_times)
+        Vocabulary(self.reviewer_ids).save(columns_dir / "reviewer_ids.npz")
+        Vocabulary(self.product_ids).save(columns_dir / "product_ids.npz")
+        save_json(
+            columns_dir / "manifest.json",
+            {"source_hash": source_hash, "rows": len(self)}
+        )
+
+    @classmethod
+    def load(cls, columns_dir, source_hash):
+        """Memory-maps cached columns, or returns None if missing or stale."""
+        columns_dir = Path(columns_dir)
+        manifest_path = columns_dir / "manifest.json"
+        if not manifest_path.exists():
+            return None
+
+        manifest = load_json(manifest_path)
+        if manifest.source_hash != source_hash:
+            return None
+
+        return cls(
+            np.load(columns_dir / "reviewer_codes.npy", mmap_mode="r"),
+            np.load(columns_dir / "product_codes.npy", mmap_mode="r"),
+            np.load(columns_dir / "ratings.npy", mmap_mode="r"),
+            np.load(columns_dir / "review_times.npy", mmap_mode="r"),
+            Vocabulary.load(columns_dir / "reviewer_ids.npz").ids,
+            Vocabulary.load(columns_dir / "product_ids.npz").ids
+        )
+
+    @staticmethod
+    def sort_ids(ids):
+        """Returns the IDs sorted like strings and each code's rank among them."""
+        order = np.argsort(ids)
+        ranks = np.empty(len(ids), dtype=np.int32)
+        ranks[order] = np.arange(len(ids), dtype=np.int32)
+        return ids[order], ranks
+
+    @classmethod
+    def to_categorical(cls, codes, ids):
+        """Returns codes as a categorical whose categories are sorted like strings."""
+        sorted_ids, ranks = cls.sort_ids(ids)
+        return pd.Categorical.from_codes(ranks[codes], categories=sorted_ids)
+
+    def to_frame(self):
+        """Returns the reviews as a DataFrame with categorical ID columns."""
+        return pd.DataFrame(
+            {
+                "reviewerID": self.to_categorical(
+                    self.reviewer_codes, self.reviewer_ids
+                ),
+                "productID": self.to_categorical(self.product_codes, self.product_ids),
+                "rating": self.ratings.astype(np.float64),
+                "unixReviewTime": self.review_times
+            }
+        )
@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+
+from recommender_system.components.serving_bundle import ServingBundle
+
+
+class ReviewTable:
+    def __init__(self, arrays):
+        """Initialises the ReviewTable object with its typed column arrays."""
+        self.reviewer_ids = arrays["reviewer_ids"]
+        self.product_ids = arrays["product_ids"]
+        self.indptr = arrays["indptr"]
+        self.encoded_reviewer_ids = arrays["encoded_reviewer_ids"]
+        self.encoded_product_ids = arrays["encoded_product_ids"]
+        self.ratings = arrays["ratings"]
+        self.review_times = arrays["review_times"]
+        self.rating_counts = None
+        if "rating_counts" in arrays:
+            self.rating_counts = arrays["rating_counts"]
+        self.applied_deltas = np.empty(0, dtype=np.str_)
+        if "applied_deltas" in arrays:
+            self.applied_deltas = arrays["applied_deltas"]
+
+    def __len__(self):
+        """Returns the number of rows in the table."""
+        return len(self.ratings)
+
+    @staticmethod
+    def write(table_path, df, reviewer_ids, product_ids, applied_deltas=()):
+        """Writes preprocessed reviews sorted by encoded reviewer as typed columns."""
+        encoded_reviewer_ids = df["encodedReviewerID"].to_numpy(dtype=np.int32)
+        encoded_product_ids = df["encodedProductID"].to_numpy(dtype=np.int32)
+        order = np.lexsort((encoded_product_ids, encoded_reviewer_ids))
+
+        indptr = np.zeros(len(reviewer_ids) + 1, dtype=np.int64)
+        np.cumsum(
+            np.bincount(encoded_reviewer_ids, minlength=len(reviewer_ids)),
+            out=indptr[1:]
+        )
+
+        arrays = {
+            "reviewer_ids": np.asarray(reviewer_ids, dtype=np.str_),
+            "product_ids": np.asarray(product_ids, dtype=np.str_),
+            "indptr": indptr,
+            "encoded_reviewer_ids": encoded_reviewer_ids[order],
+            "encoded_product_ids": encoded_product_ids[order],
+            "ratings": df["rating"].to_numpy(dtype=np.float32)[order],
+            "review_times": df["unixReviewTime"].to_numpy(dtype=np.int64)[order],
+            "applied_deltas": np.asarray(applied_deltas, dtype=np.str_)
+        }
+        if "ratingCount" in df:
+            arrays["rating_counts"] = df["ratingCount"].to_numpy(dtype=np.int32)[order]
+
+        ServingBundle.write(table_path, arrays)
+
+    @classmethod
+    def open(cls, table_path):
+        """Memory-maps a review table read-only."""
+        return cls(ServingBundle.open(table_path))
+
+    def rows(self, encoded_reviewer_id):
+        """Returns the row range of one encoded reviewer."""
+        return slice(
+            self.indptr[encoded_reviewer_id], self.indptr[encoded_reviewer_id + 1]
+        )
+
+    def rated_products(self, encoded_reviewer_id):
+        """Returns the sorted encoded IDs of the products rated by the reviewer."""
+        return self.encoded_product_ids[self.rows(encoded_reviewer_id)]
+
+    def to_frame(self):
+        """Returns the table as a DataFrame with categorical string ID columns."""
+        df = pd.DataFrame(
+            {
+                "reviewerID": pd.Categorical.from_codes(
+                    self.encoded_reviewer_ids, categories=self.reviewer_ids
+                ),
+                "productID": pd.Categorical.from_codes(
+                    self.encoded_product_ids, categories=self.product_ids
+                ),
+                "rating": self.ratings,
+                "unixReviewTime": self.review_times,
+                "encodedReviewerID": self.encoded_reviewer_ids,
+                "encodedProductID": self.encoded_product_ids
+            }
+        )
+        if self.rating_counts is not None:
+            df.insert(3, "ratingCount", self.rating_counts)
+
+        return df
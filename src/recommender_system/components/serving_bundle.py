@@ -0,0 +1,76 @@
+import json
+
+import numpy as np
+
+from recommender_system.utils import atomic_write
+
+BUNDLE_MAGIC = b"RSBUNDLE"
+BUNDLE_ALIGNMENT = 64
+
+
+class ServingBundle:
+    def __init__(self, arrays):
+        """Initialises the ServingBundle object with its named arrays."""
+        self.arrays = arrays
+
+    def __getitem__(self, name):
+        """Returns the array stored under the given name."""
+        return self.arrays[name]
+
+    def __contains__(self, name):
+        """Returns whether an array is stored under the given name."""
+        return name in self.arrays
+
+    @staticmethod
+    def align(offset):
+        """Rounds an offset up to the bundle alignment."""
+        return -(-offset // BUNDLE_ALIGNMENT) * BUNDLE_ALIGNMENT
+
+    @classmethod
+    def write(cls, bundle_path, arrays):
+        """Writes named arrays to one aligned file, renamed over any mapped bundle."""
+        arrays = {name: np.ascontiguousarray(array) for name, array in arrays.items()}
+        manifest = {}
+        offset = 0
+        for name, array in arrays.items():
+            manifest[name] = {
+                "offset": offset,
+                "dtype": array.dtype.str,
+                "shape": list(array.shape)
+            }
+            offset = cls.align(offset + array.nbytes)
+
+        header = json.dumps(manifest).encode("utf-8")
+        data_start = cls.align(len(BUNDLE_MAGIC) + 8 + len(header))
+
+        with atomic_write(bundle_path) as temporary_path:
+            with open(temporary_path, "wb") as f:
+                f.write(BUNDLE_MAGIC)
+                f.write(np.uint64(len(header)).tobytes())
+                f.write(header)
+                for name, array in arrays.items():
+                    f.seek(data_start + manifest[name]["offset"])
+                    f.write(array.tobytes())
+                f.truncate(data_start + offset)
+
+    @classmethod
+    def open(cls, bundle_path):
+        """Memory-maps a bundle read-only and returns zero-copy views of its arrays."""
+        with open(bundle_path, "rb") as f:
+            if f.read(len(BUNDLE_MAGIC)) != BUNDLE_MAGIC:
+                raise ValueError(f"Not a serving bundle: {bundle_path}")
+            header_length = int(np.frombuffer(f.read(8), dtype=np.uint64)[0])
+            manifest = json.loads(f.read(header_length).decode("utf-8"))
+
+        data_start = cls.align(len(BUNDLE_MAGIC) + 8 + header_length)
+        buffer = np.memmap(bundle_path, dtype=np.uint8, mode="r")
+
+        arrays = {}
+        for name, entry in manifest.items():
+            dtype = np.dtype(entry["dtype"])
+            shape = tuple(entry["shape"])
+            start = data_start + entry["offset"]
+            end = start + dtype.itemsize * int(np.prod(shape))
+            arrays[name] = buffer[start:end].view(dtype).reshape(shape)
+
+        return cls(arrays)
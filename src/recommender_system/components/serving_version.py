@@ -0,0 +1,37 @@
+import hashlib
+import json
+from pathlib import Path
+
+from recommender_system.utils import atomic_write, get_file_hash
+
+
+class ServingVersion:
+    def __init__(self, version_path):
+        """Initialises the ServingVersion object with the path of its manifest."""
+        self.version_path = Path(version_path)
+
+    def read(self):
+        """Returns the recorded artifact hashes, or nothing before the first export."""
+        if not self.version_path.exists():
+            return {}
+
+        with open(self.version_path) as f:
+            return json.load(f)["artifacts"]
+
+    def update(self, artifact_paths):
+        """Re-hashes the given served artifacts and atomically rewrites the manifest."""
+        artifacts = self.read()
+        for artifact_path in map(Path, artifact_paths):
+            if artifact_path.exists():
+                artifacts[str(artifact_path)] = get_file_hash(artifact_path)
+            else:
+                artifacts.pop(str(artifact_path), None)
+
+        version = hashlib.sha256(
+            json.dumps(artifacts, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        with atomic_write(self.version_path) as temporary_path:
+            with open(temporary_path, "w") as f:
+                json.dump({"version": version, "artifacts": artifacts}, f, indent=4)
+
+        return version
@@ -0,0 +1,67 @@
+import hashlib
+import json
+from pathlib import Path
+
+from recommender_system.utils import get_file_hash
+
+STAGE_FINGERPRINT_FILE = "stage_fingerprint.json"
+
+
+class StageCache:
+    def __init__(self, config_filepath, source_dir):
+        """Initialises the StageCache object with the config file and source tree."""
+        self.config_hash = get_file_hash(Path(config_filepath))
+        self.code_version = self.get_code_version(Path(source_dir))
+
+    @staticmethod
+    def get_code_version(source_dir):
+        """Returns a hash of every Python source file under the given directory."""
+        code_hash = hashlib.sha256()
+        for source_path in sorted(source_dir.rglob("*.py")):
+            code_hash.update(str(source_path.relative_to(source_dir)).encode("utf-8"))
+            code_hash.update(source_path.read_bytes())
+
+        return code_hash.hexdigest()
+
+    def fingerprint(self, stage, params):
+        """Returns a hash of a stage's input files, params keys, config and code."""
+        inputs = {
+            str(path): get_file_hash(path) if path.is_file() else None
+            for path in stage.inputs
+        }
+        stage_params = {key: params.get(key) for key in stage.params_keys}
+        payload = json.dumps(
+            {
+                "stage": stage.name,
+                "config": self.config_hash,
+                "code": self.code_version,
+                "inputs": inputs,
+                "params": stage_params
+            },
+            sort_keys=True
+        )
+
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def is_fresh(self, stage, fingerprint):
+        """Returns whether the stage ran with this fingerprint and its outputs exist."""
+        fingerprint_path = stage.root_dir / STAGE_FINGERPRINT_FILE
+        if not fingerprint_path.exists():
+            return False
+
+        with open(fingerprint_path) as f:
+            recorded = json.load(f)
+
+        return recorded.get("fingerprint") == fingerprint and all(
+            path.exists() for path in stage.outputs
+        )
+
+    def clear(self, stage):
+        """Forgets a stage's fingerprint, so an interrupted run is never skipped."""
+        (stage.root_dir / STAGE_FINGERPRINT_FILE).unlink(missing_ok=True)
+
+    def record(self, stage, fingerprint, seconds):
+        """Records the fingerprint and duration of a stage next to its outputs."""
+        stage.root_dir.mkdir(parents=True, exist_ok=True)
+        with open(stage.root_dir / STAGE_FINGERPRINT_FILE, "w") as f:
+            json.dump({"fingerprint": fingerprint, "seconds": seconds}, f, indent=4)
@@ -0,0 +1,91 @@
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from recommender_system.logging import logger
+
+
+class StageScheduler:
+    def __init__(self, stages, stage_cache, max_workers):
+        """Initialises the StageScheduler object with the stages and a worker count."""
+        self.stages = {stage.name: stage for stage in stages}
+        self.stage_cache = stage_cache
+        self.max_workers = max_workers
+        self.dependencies = self.build_dependencies(stages)
+
+    @staticmethod
+    def build_dependencies(stages):
+        """Maps each stage to the earlier stages whose outputs or params it reads."""
+        dependencies = {}
+        for index, stage in enumerate(stages):
+            dependencies[stage.name] = {
+                upstream.name
+                for upstream in stages[:index]
+                if set(stage.inputs) & set(upstream.outputs)
+                or set(stage.params_keys) & set(upstream.params_outputs)
+            }
+
+        return dependencies
+
+    def descendants(self, stage_name):
+        """Returns the stage and every stage that depends on it transitively."""
+        descendants = {stage_name}
+        for name in self.stages:
+            if self.dependencies[name] & descendants:
+                descendants.add(name)
+
+        return descendants
+
+    def skip(self, name, start_time):
+        """Logs a stage as skipped and returns its timing."""
+        seconds = time.perf_counter() - start_time
+        logger.info(f"===== Stage {name} skipped ({seconds:.2f} s) =====")
+        return "skipped", seconds
+
+    def run(self, run_stage, read_params, force=False, from_stage=None):
+        """Runs the stages in dependency order, independent ones concurrently."""
+        forced = set(self.stages) if force else set()
+        if from_stage is not None:
+            forced |= self.descendants(from_stage)
+
+        pending = list(self.stages)
+        completed = set()
+        running = {}
+        timings = {}
+
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            while pending or running:
+                for name in [n for n in pending if self.dependencies[n] <= completed]:
+                    pending.remove(name)
+                    stage = self.stages[name]
+                    start_time = time.perf_counter()
+                    fingerprint = self.stage_cache.fingerprint(stage, read_params())
+                    if name not in forced and self.stage_cache.is_fresh(
+                        stage, fingerprint
+                    ):
+                        timings[name] = self.skip(name, start_time)
+                        completed.add(name)
+                        continue
+
+                    self.stage_cache.clear(stage)
+                    future = executor.submit(run_stage, name, stage.pipeline_name)
+                    running[future] = (name, fingerprint)
+
+                if not running:
+                    if not any(self.dependencies[n] <= completed for n in pending):
+                        raise ValueError(f"Stages with unmet dependencies: {pending}")
+                    continue
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name, fingerprint = running.pop(future)
+                    if future.exception() is not None:
+                        for other in running:
+                            other.cancel()
+                        raise future.exception()
+
+                    seconds = future.result()
+                    self.stage_cache.record(self.stages[name], fingerprint, seconds)
+                    timings[name] = ("executed", seconds)
+                    completed.add(name)
+
+        return [(name, *timings[name]) for name in self.stages]
@@ -1,13 +1,75 @@
-import pickle
+import math
+import time
+from functools import partial
 from pathlib import Path
 
 import numpy as np
 import tensorflow as tf
-from tensorflow.keras.callbacks import EarlyStopping, ModelCheckpoint
+from tensorflow.keras.callbacks import Callback, EarlyStopping, ModelCheckpoint
 
-seed_value = 42
-np.random.seed(seed_value)
-tf.random.set_seed(seed_value)
+from recommender_system.components.array_store import ArrayStore
+from recommender_system.components.training_loop import TrainingLoop
+from recommender_system.logging import logger
+
+LEARNING_RATE_SCALINGS = ("linear", "sqrt")
+TRAINING_LOOPS = ("custom", "fit")
+
+
+class LearningRateWarmup(Callback):
+    def __init__(self, initial_learning_rate, target_learning_rate, warmup_steps):
+        """Initialises the LearningRateWarmup callback with its ramp endpoints."""
+        super().__init__()
+        self.initial_learning_rate = initial_learning_rate
+        self.target_learning_rate = target_learning_rate
+        self.warmup_steps = warmup_steps
+        self.step = 0
+
+    def get_learning_rate(self):
+        """Returns the learning rate linearly ramped over the warm-up steps."""
+        if self.step >= self.warmup_steps:
+            return self.target_learning_rate
+
+        progress = self.step / self.warmup_steps
+        return self.initial_learning_rate + progress * (
+            self.target_learning_rate - self.initial_learning_rate
+        )
+
+    def on_train_batch_begin(self, batch, logs=None):
+        """Sets the optimizer's learning rate for the coming step."""
+        if self.step <= self.warmup_steps:
+            tf.keras.backend.set_value(
+                self.model.optimizer.learning_rate, self.get_learning_rate()
+            )
+        self.step += 1
+
+
+class ThroughputLogger(Callback):
+    def __init__(self, number_of_examples):
+        """Initialises the ThroughputLogger callback with the examples per epoch."""
+        super().__init__()
+        self.number_of_examples = number_of_examples
+        self.start_time = None
+        self.train_seconds = None
+
+    def on_epoch_begin(self, epoch, logs=None):
+        """Starts timing the epoch."""
+        self.start_time = time.perf_counter()
+        self.train_seconds = None
+
+    def on_test_begin(self, logs=None):
+        """Stops timing before validation, so only training steps are counted."""
+        if self.start_time is not None and self.train_seconds is None:
+            self.train_seconds = time.perf_counter() - self.start_time
+
+    def on_epoch_end(self, epoch, logs=None):
+        """Logs the epoch's training throughput and records it in the history."""
+        if self.train_seconds is None:
+            self.train_seconds = time.perf_counter() - self.start_time
+
+        examples_per_second = self.number_of_examples / self.train_seconds
+        logger.info(f"Epoch {epoch + 1}: {examples_per_second:.0f} examples/sec")
+        if logs is not None:
+            logs["examples_per_second"] = examples_per_second
 
 
 class ModelTrainer:
@@ -19,24 +81,70 @@ class ModelTrainer:
         """Returns the base model."""
         return tf.keras.models.load_model(self.config.base_model_path)
 
-    def load_data(self, data_file_path):
-        """Loads and returns data."""
-        with data_file_path.open("rb") as f:
-            data = pickle.load(f)
-
-        return data
-
     def get_data(self):
-        """Returns the loaded training and validation data."""
-        data_dir = self.config.data_path
+        """Returns the memory-mapped training and validation data."""
+        array_store = ArrayStore(self.config.data_path)
 
-        X_train = self.load_data(data_dir / "X_train.pkl")
-        X_val = self.load_data(data_dir / "X_val.pkl")
-        y_train_scaled = self.load_data(data_dir / "y_train_scaled.pkl")
-        y_val_scaled = self.load_data(data_dir / "y_val_scaled.pkl")
+        X_train = list(array_store.load("X_train"))
+        X_val = list(array_store.load("X_val"))
+        y_train_scaled = array_store.load("y_train_scaled")
+        y_val_scaled = array_store.load("y_val_scaled")
 
         return X_train, X_val, y_train_scaled, y_val_scaled
 
+    def get_batch_size(self):
+        """Returns the training batch size, which is the large one when configured."""
+        return self.config.large_batch_size or self.config.batch_size
+
+    def get_learning_rate(self):
+        """Returns the learning rate scaled from the base batch size to the used one."""
+        if self.config.learning_rate_scaling not in LEARNING_RATE_SCALINGS:
+            raise ValueError(
+                f"Unknown learning rate scaling: {self.config.learning_rate_scaling}"
+            )
+
+        factor = self.get_batch_size() / self.config.batch_size
+        if self.config.learning_rate_scaling == "sqrt":
+            factor = math.sqrt(factor)
+
+        return self.config.learning_rate * factor
+
+    @staticmethod
+    def read_rows(arrays, indices):
+        """Reads a batch of rows from the memory-mapped arrays in file order."""
+        indices = np.sort(indices)
+        return tuple(array[indices] for array in arrays)
+
+    def read_batch(self, arrays, indices):
+        """Reads a batch of rows and shapes it into the two (batch, 1) model inputs."""
+        reviewer_ids, product_ids, y = tf.numpy_function(
+            partial(self.read_rows, arrays),
+            [indices],
+            [tf.as_dtype(array.dtype) for array in arrays]
+        )
+        for column in (reviewer_ids, product_ids, y):
+            column.set_shape([None])
+
+        return (tf.expand_dims(reviewer_ids, -1), tf.expand_dims(product_ids, -1)), y
+
+    def make_dataset(self, X, y, batch_size, training=False):
+        """Returns a batched, prefetched tf.data pipeline reading from the memmaps."""
+        autotune = tf.data.AUTOTUNE
+        arrays = (X[0], X[1], y)
+        dataset = tf.data.Dataset.range(len(y))
+        if training:
+            dataset = dataset.shuffle(
+                self.config.shuffle_buffer_size, seed=42, reshuffle_each_iteration=True
+            )
+
+        dataset = dataset.batch(batch_size).map(
+            partial(self.read_batch, arrays),
+            num_parallel_calls=self.config.num_parallel_calls or autotune,
+            deterministic=not training
+        )
+
+        return dataset.prefetch(self.config.prefetch_buffer_size or autotune)
+
     def get_checkpoint_best_only(self):
         """Returns the checkpoint callback for saving the best model."""
         checkpoint_path = str(self.config.trained_model_path)
@@ -60,24 +168,86 @@ class ModelTrainer:
 
         return callback
 
-    def initialise_callbacks(self):
+    def get_learning_rate_warmup(self, number_of_examples):
+        """Returns the warm-up callback for large-batch training, or None."""
+        if not self.config.large_batch_size or not self.config.warmup_epochs:
+            return None
+
+        steps_per_epoch = math.ceil(number_of_examples / self.get_batch_size())
+        return LearningRateWarmup(
+            self.config.learning_rate,
+            self.get_learning_rate(),
+            self.config.warmup_epochs * steps_per_epoch
+        )
+
+    def initialise_callbacks(self, number_of_examples):
         """Initialises and returns the list of callbacks."""
         checkpoint_best_only = self.get_checkpoint_best_only()
         early_stopping = self.get_early_stopping()
-        callbacks = [checkpoint_best_only, early_stopping]
+        throughput_logger = ThroughputLogger(number_of_examples)
+        callbacks = [throughput_logger, checkpoint_best_only, early_stopping]
+
+        learning_rate_warmup = self.get_learning_rate_warmup(number_of_examples)
+        if learning_rate_warmup is not None:
+            callbacks.insert(0, learning_rate_warmup)
 
         return callbacks
 
+    def compile_model(self, model):
+        """Recompiles the model with XLA when jit compilation is enabled for fit."""
+        if self.config.jit_compile and self.config.training_loop == "fit":
+            model.compile(
+                optimizer=model.optimizer,
+                loss="mse",
+                metrics=["accuracy"],
+                jit_compile=True
+            )
+
+        return model
+
     def train_model(self):
         """Trains the model and returns the training history."""
+        if self.config.training_loop not in TRAINING_LOOPS:
+            raise ValueError(f"Unknown training loop: {self.config.training_loop}")
+
         X_train, X_val, y_train_scaled, y_val_scaled = self.get_data()
-        model = self.get_base_model()
-        callbacks = self.initialise_callbacks()
+        model = self.compile_model(self.get_base_model())
+        callbacks = self.initialise_callbacks(len(y_train_scaled))
+
+        batch_size = self.get_batch_size()
+        tf.keras.backend.set_value(
+            model.optimizer.learning_rate, self.get_learning_rate()
+        )
+        logger.info(
+            f"Training with the {self.config.training_loop} loop, batch size "
+            f"{batch_size}, learning rate {self.get_learning_rate():.6f} and "
+            f"jit_compile={self.config.jit_compile}"
+        )
+
+        if self.config.use_tf_data or self.config.training_loop == "custom":
+            train_dataset = self.make_dataset(
+                X_train, y_train_scaled, batch_size, training=True
+            )
+            val_dataset = self.make_dataset(X_val, y_val_scaled, batch_size)
+
+            if self.config.training_loop == "custom":
+                training_loop = TrainingLoop(model, self.config.jit_compile)
+                return training_loop.fit(
+                    train_dataset, val_dataset, self.config.epochs, callbacks
+                )
+
+            return model.fit(
+                train_dataset,
+                epochs=self.config.epochs,
+                verbose=self.config.verbose,
+                callbacks=callbacks,
+                validation_data=val_dataset
+            )
 
         history = model.fit(
             X_train,
             y_train_scaled,
-            batch_size=self.config.batch_size,
+            batch_size=batch_size,
             epochs=self.config.epochs,
             verbose=self.config.verbose,
             callbacks=callbacks,
@@ -0,0 +1,150 @@
+import tensorflow as tf
+
+from recommender_system.logging import logger
+
+
+class TrainingLoop:
+    def __init__(self, model, jit_compile=False):
+        """Initialises the TrainingLoop object with a compiled model."""
+        self.model = model
+        self.optimizer = model.optimizer
+        self.embedding_tables = [
+            layer.embeddings
+            for layer in model.layers
+            if isinstance(layer, tf.keras.layers.Embedding)
+        ]
+        table_refs = {table.ref() for table in self.embedding_tables}
+        self.dense_variables = [
+            variable
+            for variable in model.trainable_variables
+            if variable.ref() not in table_refs
+        ]
+        self.first_moments = [
+            tf.Variable(tf.zeros_like(table), trainable=False)
+            for table in self.embedding_tables
+        ]
+        self.second_moments = [
+            tf.Variable(tf.zeros_like(table), trainable=False)
+            for table in self.embedding_tables
+        ]
+        self.step = tf.Variable(0, dtype=tf.int64, trainable=False)
+
+        self.gradient_step = tf.function(
+            self.compute_gradients, jit_compile=jit_compile
+        )
+        self.evaluate_step = tf.function(self.evaluate_batch, jit_compile=jit_compile)
+        self.train_step = tf.function(self.train_batch)
+
+    def compute_gradients(self, x, y):
+        """Returns the batch loss, the embedding row gradients and the dense ones."""
+        with tf.GradientTape() as tape:
+            y_hat = tf.squeeze(self.model(x, training=True), -1)
+            loss = tf.reduce_mean(tf.square(y - y_hat))
+
+        gradients = tape.gradient(loss, self.embedding_tables + self.dense_variables)
+        number_of_tables = len(self.embedding_tables)
+        table_gradients = [
+            (gradient.indices, gradient.values)
+            for gradient in gradients[:number_of_tables]
+        ]
+
+        return loss, table_gradients, gradients[number_of_tables:]
+
+    def apply_sparse_adam(self, table, first_moment, second_moment, indices, values):
+        """Applies an Adam update to only the embedding rows touched by the batch."""
+        ids, positions = tf.unique(indices)
+        gradient = tf.math.unsorted_segment_sum(values, positions, tf.size(ids))
+
+        beta_1 = tf.cast(self.optimizer.beta_1, tf.float32)
+        beta_2 = tf.cast(self.optimizer.beta_2, tf.float32)
+        epsilon = tf.cast(self.optimizer.epsilon, tf.float32)
+        step = tf.cast(self.step, tf.float32)
+        learning_rate = (
+            tf.cast(self.optimizer.learning_rate, tf.float32)
+            * tf.sqrt(1 - beta_2**step)
+            / (1 - beta_1**step)
+        )
+
+        squared_gradient = tf.square(gradient)
+        first_rows = beta_1 * tf.gather(first_moment, ids) + (1 - beta_1) * gradient
+        second_rows = (
+            beta_2 * tf.gather(second_moment, ids) + (1 - beta_2) * squared_gradient
+        )
+        first_moment.scatter_update(tf.IndexedSlices(first_rows, ids))
+        second_moment.scatter_update(tf.IndexedSlices(second_rows, ids))
+        table.scatter_sub(
+            tf.IndexedSlices(
+                learning_rate * first_rows / (tf.sqrt(second_rows) + epsilon), ids
+            )
+        )
+
+    def train_batch(self, x, y):
+        """Runs one training step and returns the batch loss."""
+        self.step.assign_add(1)
+        loss, table_gradients, dense_gradients = self.gradient_step(x, y)
+        self.optimizer.apply_gradients(zip(dense_gradients, self.dense_variables))
+
+        for table, first_moment, second_moment, (indices, values) in zip(
+            self.embedding_tables,
+            self.first_moments,
+            self.second_moments,
+            table_gradients
+        ):
+            self.apply_sparse_adam(table, first_moment, second_moment, indices, values)
+
+        return loss
+
+    def evaluate_batch(self, x, y):
+        """Returns the squared errors and binary accuracy of a validation batch."""
+        y_hat = tf.squeeze(self.model(x, training=False), -1)
+        correct = tf.cast(tf.equal(y, tf.cast(y_hat > 0.5, y.dtype)), tf.float32)
+
+        return tf.square(y - y_hat), correct
+
+    def evaluate(self, dataset):
+        """Returns the mean squared error and accuracy over a dataset."""
+        val_loss = tf.keras.metrics.Mean()
+        val_accuracy = tf.keras.metrics.Mean()
+        for x, y in dataset:
+            squared_errors, correct = self.evaluate_step(x, y)
+            val_loss.update_state(squared_errors)
+            val_accuracy.update_state(correct)
+
+        return float(val_loss.result()), float(val_accuracy.result())
+
+    def fit(self, train_dataset, val_dataset, epochs, callbacks):
+        """Trains the model with the given Keras callbacks and returns the history."""
+        callback_list = tf.keras.callbacks.CallbackList(
+            callbacks, add_history=True, model=self.model
+        )
+        self.model.stop_training = False
+
+        callback_list.on_train_begin()
+        for epoch in range(epochs):
+            callback_list.on_epoch_begin(epoch)
+            train_loss = tf.keras.metrics.Mean()
+            for batch, (x, y) in enumerate(train_dataset):
+                callback_list.on_train_batch_begin(batch)
+                train_loss.update_state(self.train_step(x, y))
+                callback_list.on_train_batch_end(batch)
+
+            callback_list.on_test_begin()
+            val_loss, val_accuracy = self.evaluate(val_dataset)
+            callback_list.on_test_end()
+
+            logs = {
+                "loss": float(train_loss.result()),
+                "val_loss": val_loss,
+                "val_accuracy": val_accuracy
+            }
+            logger.info(
+                f"Epoch {epoch + 1}/{epochs}: loss {logs['loss']:.4f}, "
+                f"val_loss {val_loss:.4f}, val_accuracy {val_accuracy:.4f}"
+            )
+            callback_list.on_epoch_end(epoch, logs)
+            if self.model.stop_training:
+                break
+
+        callback_list.on_train_end()
+
+        return self.model.history
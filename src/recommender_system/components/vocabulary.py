@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+
+UNKNOWN_ID = -1
+
+
+class Vocabulary:
+    def __init__(self, ids):
+        """Initialises the Vocabulary object with the IDs in encoded order."""
+        self.ids = np.asarray(ids, dtype=np.str_)
+        self.index = {id_: code for code, id_ in enumerate(self.ids.tolist())}
+        self.lookup = pd.Index(self.ids)
+
+    def __len__(self):
+        """Returns the number of IDs in the vocabulary."""
+        return len(self.ids)
+
+    @classmethod
+    def from_blob(cls, blob, offsets):
+        """Creates a Vocabulary from a contiguous UTF-8 blob and its offsets."""
+        blob = bytes(blob)
+        ids = [
+            blob[start:end].decode("utf-8")
+            for start, end in zip(offsets[:-1].tolist(), offsets[1:].tolist())
+        ]
+        return cls(ids)
+
+    @classmethod
+    def load(cls, vocabulary_path):
+        """Loads a Vocabulary saved as a blob and offsets."""
+        with np.load(vocabulary_path) as vocabulary:
+            return cls.from_blob(vocabulary["blob"], vocabulary["offsets"])
+
+    def save(self, vocabulary_path):
+        """Saves the vocabulary as a contiguous UTF-8 blob plus offsets."""
+        encoded_ids = [id_.encode("utf-8") for id_ in self.ids.tolist()]
+        offsets = np.zeros(len(encoded_ids) + 1, dtype=np.int64)
+        np.cumsum([len(id_) for id_ in encoded_ids], out=offsets[1:])
+        blob = np.frombuffer(b"".join(encoded_ids), dtype=np.uint8)
+        np.savez(vocabulary_path, blob=blob, offsets=offsets)
+
+    def encode(self, id_):
+        """Returns the code of an ID, or UNKNOWN_ID if it is not in the vocabulary."""
+        return self.index.get(id_, UNKNOWN_ID)
+
+    def encode_many(self, ids):
+        """Returns the codes of several IDs, with UNKNOWN_ID for unseen ones."""
+        return self.lookup.get_indexer(np.asarray(ids, dtype=np.str_)).astype(np.int32)
+
+    def extend(self, ids):
+        """Returns the vocabulary with unseen IDs appended and the codes of the IDs."""
+        ids = np.asarray(ids, dtype=np.str_)
+        codes = self.encode_many(ids)
+        unseen = codes == UNKNOWN_ID
+        vocabulary = Vocabulary(np.concatenate([self.ids, ids[unseen]]))
+        codes[unseen] = np.arange(len(self), len(vocabulary), dtype=np.int32)
+        return vocabulary, codes
+
+    def decode(self, code):
+        """Returns the ID of a code."""
+        return self.ids[code]
+
+    def decode_many(self, codes):
+        """Returns the IDs of several codes."""
+        return self.ids[codes]
@@ -2,10 +2,13 @@ import os
 from pathlib import Path
 
 from recommender_system.constants import CONFIG_FILE_PATH, PARAMS_FILE_PATH
-from recommender_system.entity import (DataIngestionConfig,
+from recommender_system.entity import (AnnIndexConfig, DataIngestionConfig,
                                        DataPreprocessingConfig,
-                                       EvaluateModelConfig, ModelConfig,
-                                       TrainModelConfig)
+                                       EvaluateCascadeConfig,
+                                       EvaluateModelConfig, ExportModelConfig,
+                                       InferenceConfig, ModelConfig,
+                                       PrecomputeRecommendationsConfig,
+                                       StageConfig, TrainModelConfig)
 from recommender_system.utils import create_directories, read_yaml
 
 
@@ -28,6 +31,7 @@ class ConfigurationManager:
             source_url=config.source_url,
             local_data_file_path=Path(config.local_data_file_path),
             unzip_directory=Path(config.unzip_directory),
+            extract_json=self.params.EXTRACT_JSON
         )
 
         return data_ingestion_config
@@ -38,7 +42,16 @@ class ConfigurationManager:
         create_directories([config.root_dir])
 
         data_preprocessing_config = DataPreprocessingConfig(
-            root_dir=Path(config.root_dir), data_path=Path(config.data_path)
+            root_dir=Path(config.root_dir),
+            data_path=Path(config.data_path),
+            review_columns_path=Path(config.review_columns_path),
+            delta_path=Path(config.delta_path),
+            applied_deltas_path=Path(config.applied_deltas_path),
+            chunk_size=self.params.CHUNK_SIZE,
+            chunked=self.params.CHUNKED_PREPROCESSING,
+            incremental=self.params.INCREMENTAL_PREPROCESSING,
+            popularity_prior_weight=self.params.POPULARITY_PRIOR_WEIGHT,
+            popularity_half_life_days=self.params.POPULARITY_HALF_LIFE_DAYS
         )
 
         return data_preprocessing_config
@@ -73,6 +86,16 @@ class ConfigurationManager:
             data_path=Path(data_config.root_dir),
             batch_size=self.params.BATCH_SIZE,
             epochs=self.params.EPOCHS,
+            learning_rate=self.params.LEARNING_RATE,
+            use_tf_data=self.params.USE_TF_DATA,
+            shuffle_buffer_size=self.params.SHUFFLE_BUFFER_SIZE,
+            prefetch_buffer_size=self.params.PREFETCH_BUFFER_SIZE,
+            num_parallel_calls=self.params.NUM_PARALLEL_CALLS,
+            large_batch_size=self.params.LARGE_BATCH_SIZE,
+            learning_rate_scaling=self.params.LEARNING_RATE_SCALING,
+            warmup_epochs=self.params.WARMUP_EPOCHS,
+            training_loop=self.params.TRAINING_LOOP,
+            jit_compile=self.params.JIT_COMPILE,
             verbose=self.params.VERBOSE
         )
 
@@ -95,3 +118,268 @@ class ConfigurationManager:
         )
 
         return evaluate_model_config
+
+    def get_export_model_config(self) -> ExportModelConfig:
+        """Returns the model export configuration."""
+        config = self.config.export_model
+        trained_model_path = self.config.train_model.trained_model_path
+        data_path = self.config.data_preprocessing.root_dir
+        create_directories([config.root_dir])
+
+        export_model_config = ExportModelConfig(
+            root_dir=Path(config.root_dir),
+            trained_model_path=Path(trained_model_path),
+            data_path=Path(data_path),
+            model_weights_path=Path(config.model_weights_path),
+            float16_weights_path=Path(config.float16_weights_path),
+            int8_weights_path=Path(config.int8_weights_path),
+            serving_bundle_path=Path(config.serving_bundle_path),
+            serving_version_path=Path(self.config.serving_version_path),
+            weights_precision=self.params.WEIGHTS_PRECISION,
+            verbose=self.params.VERBOSE
+        )
+
+        return export_model_config
+
+    def get_precompute_recommendations_config(
+        self
+    ) -> PrecomputeRecommendationsConfig:
+        """Returns the top-N recommendation precomputation configuration."""
+        config = self.config.precompute_recommendations
+        create_directories([config.root_dir])
+
+        precompute_recommendations_config = PrecomputeRecommendationsConfig(
+            root_dir=Path(config.root_dir),
+            top_n_products_path=Path(config.top_n_products_path),
+            top_n_ratings_path=Path(config.top_n_ratings_path),
+            serving_version_path=Path(self.config.serving_version_path),
+            top_n=self.params.TOP_N
+        )
+
+        return precompute_recommendations_config
+
+    def get_ann_index_config(self) -> AnnIndexConfig:
+        """Returns the product ANN index configuration."""
+        config = self.config.ann_index
+        model_weights_path = self.config.export_model.model_weights_path
+        create_directories([config.root_dir])
+
+        ann_index_config = AnnIndexConfig(
+            root_dir=Path(config.root_dir),
+            index_path=Path(config.index_path),
+            model_weights_path=Path(model_weights_path),
+            number_of_lists=self.params.ANN_NUMBER_OF_LISTS,
+            iterations=self.params.ANN_ITERATIONS
+        )
+
+        return ann_index_config
+
+    def get_inference_config(self) -> InferenceConfig:
+        """Returns the inference configuration."""
+        trained_model_path = self.config.train_model.trained_model_path
+        data_path = self.config.data_preprocessing.root_dir
+        model_weights_paths = {
+            "float32": self.config.export_model.model_weights_path,
+            "float16": self.config.export_model.float16_weights_path,
+            "int8": self.config.export_model.int8_weights_path
+        }
+        model_weights_path = model_weights_paths[self.params.WEIGHTS_PRECISION]
+        top_n_config = self.config.precompute_recommendations
+
+        inference_config = InferenceConfig(
+            trained_model_path=Path(trained_model_path),
+            data_path=Path(data_path),
+            model_weights_path=Path(model_weights_path),
+            serving_bundle_path=Path(self.config.export_model.serving_bundle_path),
+            serving_version_path=Path(self.config.serving_version_path),
+            use_serving_bundle=self.params.USE_SERVING_BUNDLE,
+            inference_backend=self.params.INFERENCE_BACKEND,
+            tile_size=self.params.TILE_SIZE,
+            top_n_products_path=Path(top_n_config.top_n_products_path),
+            top_n_ratings_path=Path(top_n_config.top_n_ratings_path),
+            use_top_n_table=self.params.USE_TOP_N_TABLE,
+            ann_index_path=Path(self.config.ann_index.index_path),
+            ann_number_of_probes=self.params.ANN_NUMBER_OF_PROBES,
+            use_cascade=self.params.USE_CASCADE,
+            cascade_candidates=self.params.CASCADE_CANDIDATES,
+            cache_max_megabytes=self.params.CACHE_MAX_MEGABYTES,
+            cache_ttl_seconds=self.params.CACHE_TTL_SECONDS,
+            max_batch_size=self.params.MAX_BATCH_SIZE,
+            max_wait_ms=self.params.MAX_WAIT_MS,
+            cold_start_min_ratings=self.params.COLD_START_MIN_RATINGS,
+            popularity_blend_weight=self.params.POPULARITY_BLEND_WEIGHT,
+            min_rating=self.params.MIN_RATING,
+            max_rating=self.params.MAX_RATING
+        )
+
+        return inference_config
+
+    def get_evaluate_cascade_config(self) -> EvaluateCascadeConfig:
+        """Returns the inference cascade evaluation configuration."""
+        config = self.config.evaluate_cascade
+        create_directories([config.root_dir])
+
+        evaluate_cascade_config = EvaluateCascadeConfig(
+            root_dir=Path(config.root_dir),
+            candidate_sizes=list(self.params.CASCADE_CANDIDATE_SIZES)
+        )
+
+        return evaluate_cascade_config
+
+    def get_stage_configs(self) -> list:
+        """Returns the pipeline stages in order with their inputs and outputs."""
+        config = self.config
+        data_dir = Path(config.data_preprocessing.root_dir)
+        arrays_manifest = data_dir / "arrays.json"
+        review_table = data_dir / "preprocessed_data.bin"
+        vocabularies = [
+            data_dir / "reviewer_vocabulary.npz",
+            data_dir / "product_vocabulary.npz"
+        ]
+        popularity_index = data_dir / "popularity_index.npz"
+        trained_model = Path(config.train_model.trained_model_path)
+        model_weights = Path(config.export_model.model_weights_path)
+        serving_bundle = Path(config.export_model.serving_bundle_path)
+        serving_version = Path(config.serving_version_path)
+        top_n_tables = [
+            Path(config.precompute_recommendations.top_n_products_path),
+            Path(config.precompute_recommendations.top_n_ratings_path)
+        ]
+        ann_index = Path(config.ann_index.index_path)
+        inference_keys = [
+            "COLD_START_MIN_RATINGS",
+            "INFERENCE_BACKEND",
+            "POPULARITY_BLEND_WEIGHT",
+            "TILE_SIZE",
+            "USE_SERVING_BUNDLE",
+            "WEIGHTS_PRECISION"
+        ]
+
+        return [
+            StageConfig(
+                name="Data Ingestion",
+                pipeline_name="DataIngestionPipeline",
+                root_dir=Path(config.data_ingestion.root_dir),
+                inputs=[],
+                outputs=[Path(config.data_ingestion.local_data_file_path)],
+                params_keys=["EXTRACT_JSON"]
+            ),
+            StageConfig(
+                name="Data Preprocessing",
+                pipeline_name="DataPreprocessingPipeline",
+                root_dir=data_dir,
+                inputs=[
+                    Path(config.data_preprocessing.data_path),
+                    Path(config.data_preprocessing.delta_path)
+                ],
+                outputs=[arrays_manifest, review_table, popularity_index]
+                + vocabularies,
+                params_keys=[
+                    "CHUNK_SIZE",
+                    "CHUNKED_PREPROCESSING",
+                    "INCREMENTAL_PREPROCESSING",
+                    "POPULARITY_HALF_LIFE_DAYS",
+                    "POPULARITY_PRIOR_WEIGHT"
+                ],
+                params_outputs=[
+                    "MAX_RATING",
+                    "MIN_RATING",
+                    "NUMBER_OF_PRODUCTS",
+                    "NUMBER_OF_REVIEWERS"
+                ]
+            ),
+            StageConfig(
+                name="Build Model",
+                pipeline_name="ModelBuilderPipeline",
+                root_dir=Path(config.build_model.root_dir),
+                inputs=[],
+                outputs=[Path(config.build_model.model_path)],
+                params_keys=[
+                    "LEARNING_RATE",
+                    "NUMBER_OF_DIMENSIONS",
+                    "NUMBER_OF_PRODUCTS",
+                    "NUMBER_OF_REVIEWERS"
+                ]
+            ),
+            StageConfig(
+                name="Train Model",
+                pipeline_name="ModelTrainerPipeline",
+                root_dir=Path(config.train_model.root_dir),
+                inputs=[Path(config.build_model.model_path), arrays_manifest],
+                outputs=[trained_model],
+                params_keys=[
+                    "BATCH_SIZE",
+                    "EPOCHS",
+                    "JIT_COMPILE",
+                    "LARGE_BATCH_SIZE",
+                    "LEARNING_RATE",
+                    "LEARNING_RATE_SCALING",
+                    "NUM_PARALLEL_CALLS",
+                    "PREFETCH_BUFFER_SIZE",
+                    "SHUFFLE_BUFFER_SIZE",
+                    "TRAINING_LOOP",
+                    "USE_TF_DATA",
+                    "WARMUP_EPOCHS"
+                ]
+            ),
+            StageConfig(
+                name="Evaluate Model",
+                pipeline_name="ModelEvaluationPipeline",
+                root_dir=Path(config.evaluate_model.root_dir),
+                inputs=[trained_model, arrays_manifest],
+                outputs=[
+                    Path(config.evaluate_model.root_dir) / "evaluation_results.json",
+                    Path(config.evaluate_model.root_dir) / "ndcg_result.json"
+                ],
+                params_keys=["MAX_RATING", "MIN_RATING"]
+            ),
+            StageConfig(
+                name="Export Model",
+                pipeline_name="ModelExportPipeline",
+                root_dir=Path(config.export_model.root_dir),
+                inputs=[trained_model, arrays_manifest, review_table] + vocabularies,
+                outputs=[
+                    model_weights,
+                    Path(config.export_model.float16_weights_path),
+                    Path(config.export_model.int8_weights_path),
+                    serving_bundle,
+                    serving_version
+                ],
+                params_keys=["MAX_RATING", "MIN_RATING", "WEIGHTS_PRECISION"]
+            ),
+            StageConfig(
+                name="Precompute Recommendations",
+                pipeline_name="PrecomputeRecommendationsPipeline",
+                root_dir=Path(config.precompute_recommendations.root_dir),
+                inputs=[
+                    trained_model,
+                    model_weights,
+                    serving_bundle,
+                    review_table,
+                    popularity_index
+                ],
+                outputs=top_n_tables + [serving_version],
+                params_keys=["TOP_N"] + inference_keys
+            ),
+            StageConfig(
+                name="Build ANN Index",
+                pipeline_name="AnnIndexPipeline",
+                root_dir=Path(config.ann_index.root_dir),
+                inputs=[model_weights],
+                outputs=[ann_index],
+                params_keys=["ANN_ITERATIONS", "ANN_NUMBER_OF_LISTS"]
+            ),
+            StageConfig(
+                name="Evaluate Cascade",
+                pipeline_name="CascadeEvaluationPipeline",
+                root_dir=Path(config.evaluate_cascade.root_dir),
+                inputs=[ann_index, serving_bundle, review_table] + top_n_tables,
+                outputs=[
+                    Path(config.evaluate_cascade.root_dir) / "cascade_results.json"
+                ],
+                params_keys=[
+                    "ANN_NUMBER_OF_PROBES",
+                    "CASCADE_CANDIDATE_SIZES"
+                ] + inference_keys
+            )
+        ]
@@ -1,5 +1,5 @@
-from recommender_system.entity.entity_config import (DataIngestionConfig,
-                                                     DataPreprocessingConfig,
-                                                     EvaluateModelConfig,
-                                                     ModelConfig,
-                                                     TrainModelConfig)
+from recommender_system.entity.entity_config import (
+    AnnIndexConfig, DataIngestionConfig, DataPreprocessingConfig,
+    EvaluateCascadeConfig, EvaluateModelConfig, ExportModelConfig,
+    InferenceConfig, ModelConfig, PrecomputeRecommendationsConfig, StageConfig,
+    TrainModelConfig)
@@ -1,5 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Optional
 
 
 @dataclass(frozen=True)
@@ -9,6 +10,7 @@ class DataIngestionConfig:
     source_url: str
     local_data_file_path: Path
     unzip_directory: Path
+    extract_json: bool
 
 
 @dataclass(frozen=True)
@@ -16,6 +18,14 @@ class DataPreprocessingConfig:
     """Represents the configuration for data preprocessing."""
     root_dir: Path
     data_path: Path
+    review_columns_path: Path
+    delta_path: Path
+    applied_deltas_path: Path
+    chunk_size: int
+    chunked: bool
+    incremental: bool
+    popularity_prior_weight: Optional[float]
+    popularity_half_life_days: Optional[float]
 
 
 @dataclass(frozen=True)
@@ -38,8 +48,18 @@ class TrainModelConfig:
     data_path: Path
     batch_size: int
     epochs: int
+    learning_rate: float
+    use_tf_data: bool
+    shuffle_buffer_size: int
+    prefetch_buffer_size: Optional[int]
+    num_parallel_calls: Optional[int]
+    large_batch_size: Optional[int]
+    learning_rate_scaling: str
+    warmup_epochs: int
+    training_loop: str
+    jit_compile: bool
     verbose: int
-    
+
 
 @dataclass(frozen=True)
 class EvaluateModelConfig:
@@ -50,4 +70,85 @@ class EvaluateModelConfig:
     min_rating: float
     max_rating: float
     verbose: int
-    
\ No newline at end of file
+
+
+@dataclass(frozen=True)
+class ExportModelConfig:
+    """Represents the configuration for exporting the trained model."""
+    root_dir: Path
+    trained_model_path: Path
+    data_path: Path
+    model_weights_path: Path
+    float16_weights_path: Path
+    int8_weights_path: Path
+    serving_bundle_path: Path
+    serving_version_path: Path
+    weights_precision: str
+    verbose: int
+
+
+@dataclass(frozen=True)
+class PrecomputeRecommendationsConfig:
+    """Represents the configuration for precomputing top-N recommendations."""
+    root_dir: Path
+    top_n_products_path: Path
+    top_n_ratings_path: Path
+    serving_version_path: Path
+    top_n: int
+
+
+@dataclass(frozen=True)
+class AnnIndexConfig:
+    """Represents the configuration for building the product ANN index."""
+    root_dir: Path
+    index_path: Path
+    model_weights_path: Path
+    number_of_lists: int
+    iterations: int
+
+
+@dataclass(frozen=True)
+class InferenceConfig:
+    """Represents the configuration for generating recommendations."""
+    trained_model_path: Path
+    data_path: Path
+    model_weights_path: Path
+    serving_bundle_path: Path
+    serving_version_path: Path
+    use_serving_bundle: bool
+    inference_backend: str
+    tile_size: int
+    top_n_products_path: Path
+    top_n_ratings_path: Path
+    use_top_n_table: bool
+    ann_index_path: Path
+    ann_number_of_probes: int
+    use_cascade: bool
+    cascade_candidates: int
+    cache_max_megabytes: int
+    cache_ttl_seconds: Optional[float]
+    max_batch_size: int
+    max_wait_ms: float
+    cold_start_min_ratings: int
+    popularity_blend_weight: float
+    min_rating: float
+    max_rating: float
+
+
+@dataclass(frozen=True)
+class StageConfig:
+    """Represents the declared inputs and outputs of a pipeline stage."""
+    name: str
+    pipeline_name: str
+    root_dir: Path
+    inputs: list
+    outputs: list
+    params_keys: list
+    params_outputs: list = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class EvaluateCascadeConfig:
+    """Represents the configuration for evaluating the inference cascade."""
+    root_dir: Path
+    candidate_sizes: list
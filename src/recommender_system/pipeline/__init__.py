@@ -1,11 +1,39 @@
-from recommender_system.pipeline.stage_01_data_ingestion import \
-    DataIngestionPipeline
-from recommender_system.pipeline.stage_02_data_preprocessing import \
-    DataPreprocessingPipeline
-from recommender_system.pipeline.stage_03_build_model import \
-    ModelBuilderPipeline
-from recommender_system.pipeline.stage_04_train_model import \
-    ModelTrainerPipeline
-from recommender_system.pipeline.stage_05_evaluate_model import \
-    ModelEvaluationPipeline
-from recommender_system.pipeline.stage_06_inference import RecommendProducts
+import importlib
+
+_PIPELINE_MODULES = {
+    "DataIngestionPipeline": "recommender_system.pipeline.stage_01_data_ingestion",
+    "DataPreprocessingPipeline": (
+        "recommender_system.pipeline.stage_02_data_preprocessing"
+    ),
+    "ModelBuilderPipeline": "recommender_system.pipeline.stage_03_build_model",
+    "ModelTrainerPipeline": "recommender_system.pipeline.stage_04_train_model",
+    "ModelEvaluationPipeline": "recommender_system.pipeline.stage_05_evaluate_model",
+    "RecommenderEngine": "recommender_system.pipeline.stage_06_inference",
+    "RecommendProducts": "recommender_system.pipeline.stage_06_inference",
+    "get_cache_stats": "recommender_system.pipeline.stage_06_inference",
+    "get_recommender_engine": "recommender_system.pipeline.stage_06_inference",
+    "reload_recommender_engine": "recommender_system.pipeline.stage_06_inference",
+    "ModelExportPipeline": "recommender_system.pipeline.stage_07_export_model",
+    "PrecomputeRecommendationsPipeline": (
+        "recommender_system.pipeline.stage_08_precompute_recommendations"
+    ),
+    "AnnIndexPipeline": "recommender_system.pipeline.stage_09_build_ann_index",
+    "CascadeEvaluationPipeline": (
+        "recommender_system.pipeline.stage_10_evaluate_cascade"
+    )
+}
+
+__all__ = list(_PIPELINE_MODULES)
+
+
+def __getattr__(name):
+    """Imports a pipeline's module on first access, so unused ones stay unloaded."""
+    if name not in _PIPELINE_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    return getattr(importlib.import_module(_PIPELINE_MODULES[name]), name)
+
+
+def __dir__():
+    """Lists the lazily loaded pipelines alongside the module attributes."""
+    return sorted(list(globals()) + __all__)
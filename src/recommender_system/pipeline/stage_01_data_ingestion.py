@@ -13,4 +13,5 @@ class DataIngestionPipeline:
         data_ingestion_config = config.get_data_ingestion_config()
         data_ingestion = DataIngestion(data_ingestion_config)
         data_ingestion.download_data()
-        data_ingestion.extract_and_rename_json()
+        if data_ingestion_config.extract_json:
+            data_ingestion.extract_and_rename_json()
@@ -12,8 +12,14 @@ class DataPreprocessingPipeline:
         config = ConfigurationManager()
         data_preprocessing_config = config.get_data_preprocessing_config()
         data_preprocessor = DataPreprocessor(data_preprocessing_config)
-        data_preprocessor.load_data()
-        data_preprocessor.encode_labels()
+        if data_preprocessing_config.incremental:
+            data_preprocessor.update_data()
+        elif data_preprocessing_config.chunked:
+            data_preprocessor.load_data_chunked()
+        else:
+            data_preprocessor.load_data()
+            data_preprocessor.encode_labels()
         data_preprocessor.calculate_statistics()
+        data_preprocessor.build_popularity_index()
         data_preprocessor.prepare_data()
         data_preprocessor.save_preprocessed_data()
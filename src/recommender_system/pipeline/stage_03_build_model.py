@@ -1,6 +1,7 @@
 from recommender_system.components import ModelBuilder
 from recommender_system.config import ConfigurationManager
 from recommender_system.logging import logger
+from recommender_system.utils import set_seeds
 
 
 class ModelBuilderPipeline:
@@ -9,6 +10,7 @@ class ModelBuilderPipeline:
 
     def main(self):
         """Executes the main model building pipeline steps."""
+        set_seeds()
         config = ConfigurationManager()
         model_config = config.get_build_model_config()
         model_builder = ModelBuilder(model_config)
@@ -1,6 +1,7 @@
 from recommender_system.components import ModelTrainer
 from recommender_system.config import ConfigurationManager
 from recommender_system.logging import logger
+from recommender_system.utils import set_seeds
 
 
 class ModelTrainerPipeline:
@@ -9,6 +10,7 @@ class ModelTrainerPipeline:
 
     def main(self):
         """Executes the main model training pipeline steps."""
+        set_seeds()
         config = ConfigurationManager()
         train_config = config.get_train_model_config()
         model_trainer = ModelTrainer(train_config)
@@ -1,113 +1,552 @@
-import os
-import pickle
+import threading
 
 import numpy as np
 import pandas as pd
-import yaml
-from tensorflow.keras.models import load_model
 
-from recommender_system.utils import unscale_targets
+from recommender_system.components import (IVFIndex, NumpyScorer,
+                                           RecommendationCache, ReviewTable,
+                                           ServingBundle, Vocabulary)
+from recommender_system.components.vocabulary import UNKNOWN_ID
+from recommender_system.config import ConfigurationManager
+from recommender_system.logging import logger
+from recommender_system.utils import (get_file_hash, scale_targets,
+                                      unscale_targets)
 
 
-class RecommendProducts:
-    def __init__(self, reviewer_id):
-        self.reviewer_id = reviewer_id
+class RecommenderEngine:
+    def __init__(self, config, cache=None):
+        """Initialises the RecommenderEngine and loads all inference artifacts once."""
+        self.config = config
+        self.cache = cache
+        self.min_rating = config.min_rating
+        self.max_rating = config.max_rating
+        self._predict_lock = threading.Lock()
+        self._model_lock = threading.Lock()
+        self.model = None
+        self.top_n_products = None
+        self.load_model_version()
+        self.load_serving_bundle()
+        self.load_reviewer_vocabulary()
+        self.load_product_vocabulary()
+        self.load_rated_products_index()
+        self.load_popularity_index()
+
+        if self.config.use_top_n_table and self.config.top_n_products_path.exists():
+            self.load_top_n_table()
+        else:
+            self.ensure_model_loaded()
+
+    def get_model_signature(self):
+        """Returns the inode, modification time and size of the serving version."""
+        if not self.config.serving_version_path.exists():
+            return None
+
+        stat = self.config.serving_version_path.stat()
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def load_model_version(self):
+        """Identifies the served artifacts by the content hash of their manifest."""
+        self.model_signature = self.get_model_signature()
+        self.model_version = None
+        if self.model_signature is not None:
+            self.model_version = get_file_hash(self.config.serving_version_path)
+
+    def is_stale(self):
+        """Returns whether Export or Precompute has published new artifacts."""
+        return self.get_model_signature() != self.model_signature
+
+    def load_serving_bundle(self):
+        """Memory-maps the serving bundle read-only so processes share its pages."""
+        self.bundle = None
+        if self.config.use_serving_bundle and self.config.serving_bundle_path.exists():
+            self.bundle = ServingBundle.open(self.config.serving_bundle_path)
 
     def load_model(self):
-        """Loads the trained model."""
-        model_path = os.path.join("artifacts", "train_model", "trained_model.h5")
-        self.model = load_model(model_path)
-
-    def load_data(self):
-        """Loads the preprocessed data."""
-        data_path = os.path.join(
-            "artifacts", "data_preprocessing", "preprocessed_data.csv"
-        )
-        self.df = pd.read_csv(data_path)
+        """Loads the trained model or its exported weights for the NumPy backend."""
+        if self.config.inference_backend == "numpy" and self.bundle is not None:
+            self.model = NumpyScorer(self.bundle)
+        elif self.config.inference_backend == "numpy":
+            self.model = NumpyScorer.from_file(self.config.model_weights_path)
+        else:
+            from tensorflow.keras.models import load_model
 
-    def load_reviewer_encoder(self):
-        """Loads the reviewer encoder used for preprocessing reviewer IDs."""
-        reviewer_encoder_path = os.path.join(
-            "artifacts", "data_preprocessing", "reviewer_encoder.pkl"
-        )
-        with open(reviewer_encoder_path, "rb") as f:
-            self.reviewer_encoder = pickle.load(f)
-
-    def load_params(self):
-        """Loads the parameters used for generating recommendations."""
-        params_path = os.path.join("params", "params.yaml")
-        with open(params_path, "r") as f:
-            self.params = yaml.safe_load(f)
-        self.min_rating = self.params["MIN_RATING"]
-        self.max_rating = self.params["MAX_RATING"]
-
-    def preprocess_reviewer(self):
-        """Preprocesses the reviewer ID by encoding it using the reviewer encoder."""
-        encoded_reviewer_id = self.reviewer_encoder.transform([self.reviewer_id])
-        return encoded_reviewer_id
+            self.model = load_model(self.config.trained_model_path)
 
-    def preprocess_rated_products(self):
-        """Returns the products rated by the reviewer and their corresponding encoded IDs."""
-        rated_products_id = list(
-            self.df[self.df["reviewerID"] == self.reviewer_id]["productID"]
-        )
-        encoded_rated_products_id = list(
-            self.df[self.df["reviewerID"] == self.reviewer_id]["encodedProductID"]
+    def load_ann_index(self):
+        """Loads the exported embedding tables and the IVF index over the products."""
+        self.embeddings = None
+        self.ann_index = None
+
+        if self.config.inference_backend == "numpy":
+            self.embeddings = self.model
+        elif self.bundle is not None:
+            self.embeddings = NumpyScorer(self.bundle)
+        elif self.config.model_weights_path.exists():
+            self.embeddings = NumpyScorer.from_file(self.config.model_weights_path)
+
+        if self.embeddings is not None and self.config.ann_index_path.exists():
+            self.ann_index = IVFIndex.from_file(
+                self.config.ann_index_path, self.embeddings.product_embeddings
+            )
+
+    def ensure_model_loaded(self):
+        """Loads and warms up the model on first use for live scoring."""
+        if self.model is None:
+            with self._model_lock:
+                if self.model is None:
+                    self.load_model()
+                    self.load_ann_index()
+                    self.warm_up()
+
+    def load_reviewer_vocabulary(self):
+        """Loads the vocabulary used for encoding reviewer IDs."""
+        if self.bundle is not None:
+            self.reviewer_vocabulary = Vocabulary(self.bundle["reviewer_ids"])
+        else:
+            self.reviewer_vocabulary = Vocabulary.load(
+                self.config.data_path / "reviewer_vocabulary.npz"
+            )
+
+    def load_product_vocabulary(self):
+        """Loads the product vocabulary and the encoded ID to product ID lookup."""
+        if self.bundle is not None:
+            self.product_vocabulary = Vocabulary(self.bundle["product_ids"])
+        else:
+            self.product_vocabulary = Vocabulary.load(
+                self.config.data_path / "product_vocabulary.npz"
+            )
+        self.product_ids = self.product_vocabulary.ids
+
+    def load_rated_products_index(self):
+        """Loads the CSR index of products rated by each encoded reviewer."""
+        if self.bundle is not None:
+            self.rated_products_indptr = self.bundle["rated_products_indptr"]
+            self.rated_products_indices = self.bundle["rated_products_indices"]
+            self.number_of_products = len(self.bundle["product_ids"])
+            return
+
+        review_table_path = self.config.data_path / "preprocessed_data.bin"
+        if review_table_path.exists():
+            review_table = ReviewTable.open(review_table_path)
+            self.rated_products_indptr = review_table.indptr
+            self.rated_products_indices = review_table.encoded_product_ids
+            self.number_of_products = len(review_table.product_ids)
+            return
+
+        index = np.load(self.config.data_path / "rated_products_index.npz")
+        self.rated_products_indptr = index["indptr"]
+        self.rated_products_indices = index["indices"]
+        self.number_of_products = int(index["number_of_products"])
+
+    def load_popularity_index(self):
+        """Loads the popularity ranking used for cold-start reviewers."""
+        self.popularity_ranking = None
+        popularity_index_path = self.config.data_path / "popularity_index.npz"
+        if not popularity_index_path.exists():
+            return
+
+        with np.load(popularity_index_path) as popularity_index:
+            self.popularity_ranking = popularity_index["ranking"]
+            self.popularity_ratings = popularity_index["scores"]
+        self.popularity_scores = scale_targets(
+            self.popularity_ratings, self.min_rating, self.max_rating
         )
 
-        return rated_products_id, encoded_rated_products_id
+    def load_top_n_table(self):
+        """Memory-maps the precomputed top-N recommendation tables."""
+        self.top_n_products = np.load(self.config.top_n_products_path, mmap_mode="r")
+        self.top_n_ratings = np.load(self.config.top_n_ratings_path, mmap_mode="r")
+        self.top_n = self.top_n_products.shape[1]
+
+    def warm_up(self):
+        """Runs a prediction so the first request does not pay for graph tracing."""
+        if self.config.inference_backend == "numpy":
+            return
+
+        example = [np.zeros(1, dtype=np.int32), np.zeros(1, dtype=np.int32)]
+        self.model.predict(example, verbose=0)
+        logger.info("Recommender engine warmed up")
+
+    def preprocess_reviewer(self, reviewer_id):
+        """Preprocesses the reviewer ID by encoding it using the reviewer vocabulary."""
+        encoded_reviewer_id = self.reviewer_vocabulary.encode(reviewer_id)
+        if encoded_reviewer_id == UNKNOWN_ID:
+            raise ValueError(f"Unknown reviewer ID: {reviewer_id}")
+
+        return encoded_reviewer_id
+
+    def preprocess_rated_products(self, encoded_reviewer_id):
+        """Returns the sorted encoded IDs of the products rated by the reviewer."""
+        start = self.rated_products_indptr[encoded_reviewer_id]
+        end = self.rated_products_indptr[encoded_reviewer_id + 1]
+        return self.rated_products_indices[start:end]
 
     def find_unrated_products(self, encoded_rated_products_id):
         """Finds the unrated products for the given reviewer."""
-        unrated_products = []
-        for i in range(
-            min(self.df["encodedProductID"]), max(self.df["encodedProductID"]) + 1
-        ):
-            if i not in encoded_rated_products_id:
-                unrated_products.append(i)
-
-        return unrated_products
+        unrated_mask = np.ones(self.number_of_products, dtype=bool)
+        unrated_mask[encoded_rated_products_id] = False
+        return np.flatnonzero(unrated_mask)
 
     def make_predictions(self, encoded_reviewer_id, unrated_products):
         """Makes predictions for the unrated products using the trained model."""
-        example = [
-            np.asarray(list(encoded_reviewer_id) * len(unrated_products)),
-            np.asarray(unrated_products)
-        ]
-        predicted_ratings = self.model.predict(example, verbose=0)
+        self.ensure_model_loaded()
+        if self.config.inference_backend == "numpy":
+            predicted_ratings = self.model.score(
+                encoded_reviewer_id[0], unrated_products
+            )
+        else:
+            example = [
+                np.full(len(unrated_products), encoded_reviewer_id[0]),
+                np.asarray(unrated_products)
+            ]
+            with self._predict_lock:
+                predicted_ratings = self.model.predict(example, verbose=0)[:, 0]
         predicted_ratings = unscale_targets(
             predicted_ratings, self.min_rating, self.max_rating
         )
 
         return predicted_ratings
 
+    def retrieve_candidates(self, encoded_reviewer_id, num_candidates):
+        """Retrieves the products with the highest matrix factorisation scores."""
+        self.ensure_model_loaded()
+        if self.embeddings is None:
+            raise ValueError("Candidate retrieval requires the exported model weights")
+
+        query = (
+            self.embeddings.reviewer_embeddings[encoded_reviewer_id]
+            * self.embeddings.output_mf_kernel
+        )
+
+        if self.ann_index is not None:
+            return self.ann_index.search(
+                query, num_candidates, self.config.ann_number_of_probes
+            )
+
+        scores = self.embeddings.product_embeddings @ query
+        num_candidates = min(num_candidates, len(scores))
+        candidates = np.argpartition(-scores, num_candidates - 1)[:num_candidates]
+        return candidates[np.argsort(-scores[candidates])]
+
+    def find_cascade_candidates(self, encoded_reviewer_id, num_candidates):
+        """Finds the unrated products with the highest matrix factorisation scores."""
+        encoded_rated_products_id = self.preprocess_rated_products(encoded_reviewer_id)
+        candidates = self.retrieve_candidates(
+            encoded_reviewer_id, num_candidates + len(encoded_rated_products_id)
+        )
+        unrated = ~np.isin(candidates, encoded_rated_products_id, assume_unique=True)
+        return candidates[unrated][:num_candidates]
+
+    def select_recommendations(self, unrated_products, predicted_ratings, num_items):
+        """Returns the encoded IDs and ratings of the highest rated products."""
+        predicted_ratings = np.asarray(predicted_ratings).ravel()
+        num_items = max(min(num_items, len(predicted_ratings)), 0)
+
+        if num_items == 0:
+            top_items = np.empty(0, dtype=np.int64)
+        else:
+            top_items = np.argpartition(-predicted_ratings, num_items - 1)[:num_items]
+            top_items = top_items[np.argsort(-predicted_ratings[top_items])]
+
+        return np.asarray(unrated_products)[top_items], predicted_ratings[top_items]
+
+    def build_recommendations(self, encoded_products, predicted_ratings):
+        """Builds the recommendations table from encoded product IDs and ratings."""
+        recommendations = pd.DataFrame(
+            {
+                "recommendedProductID": self.product_ids[encoded_products],
+                "predictedRating": predicted_ratings
+            }
+        )
+
+        return recommendations
+
     def generate_recommendations(self, unrated_products, predicted_ratings, num_items):
         """Generates recommendations based on the predicted ratings for the unrated products."""
-        test_df = pd.DataFrame(unrated_products, columns=["encodedProductID"])
-        test_df["predictedRating"] = predicted_ratings
-        test_df = test_df.merge(
-            self.df, on="encodedProductID", how="left"
-        ).drop_duplicates(subset="productID")
-        test_df = test_df[["productID", "predictedRating"]].sort_values(
-            "predictedRating", ascending=False
+        encoded_products, ratings = self.select_recommendations(
+            unrated_products, predicted_ratings, num_items
+        )
+        return self.build_recommendations(encoded_products, ratings)
+
+    def can_use_top_n_table(self, num_items):
+        """Returns whether a request can be served from the top-N tables."""
+        return self.top_n_products is not None and num_items <= self.top_n
+
+    def lookup_recommendations(self, encoded_reviewer_id, num_items):
+        """Returns the precomputed recommendations of an encoded reviewer."""
+        num_items = max(num_items, 0)
+        top_products = self.top_n_products[encoded_reviewer_id, :num_items]
+        top_ratings = self.top_n_ratings[encoded_reviewer_id, :num_items]
+        unrated = top_products >= 0
+
+        return self.build_recommendations(top_products[unrated], top_ratings[unrated])
+
+    def recommend_popular(self, num_items):
+        """Recommends the most popular products to a reviewer without a history."""
+        if self.popularity_ranking is None:
+            raise ValueError("Unknown reviewer ID and no popularity index available")
+
+        top_products = self.popularity_ranking[:max(num_items, 0)]
+        return self.build_recommendations(
+            top_products, self.popularity_ratings[top_products]
+        )
+
+    def is_cold_start(self, encoded_reviewer_ids):
+        """Returns which reviewers have too few ratings to rely on the model alone."""
+        encoded_reviewer_ids = np.asarray(encoded_reviewer_ids)
+        if self.popularity_ranking is None or self.config.popularity_blend_weight <= 0:
+            return np.zeros(encoded_reviewer_ids.shape, dtype=bool)
+
+        counts = (
+            self.rated_products_indptr[encoded_reviewer_ids + 1]
+            - self.rated_products_indptr[encoded_reviewer_ids]
         )
-        test_df = test_df.rename(columns={"productID": "recommendedProductID"})
-        recommendations = test_df.head(num_items)
+        return counts < self.config.cold_start_min_ratings
+
+    def blend_with_popularity(self, predicted_scores, encoded_products, scaled=False):
+        """Blends predicted scores with the popularity scores of the same products."""
+        popularity = self.popularity_scores if scaled else self.popularity_ratings
+        blend_weight = self.config.popularity_blend_weight
+        return (1 - blend_weight) * predicted_scores + blend_weight * popularity[
+            encoded_products
+        ]
+
+    def rank_products(self, encoded_reviewer_id, num_items, num_candidates=None):
+        """Returns the top products among all unrated or only the cascade candidates."""
+        if num_candidates is None:
+            encoded_rated_products_id = self.preprocess_rated_products(
+                encoded_reviewer_id
+            )
+            candidates = self.find_unrated_products(encoded_rated_products_id)
+        else:
+            candidates = self.find_cascade_candidates(
+                encoded_reviewer_id, num_candidates
+            )
+
+        predicted_ratings = self.make_predictions([encoded_reviewer_id], candidates)
+        if self.is_cold_start(encoded_reviewer_id):
+            predicted_ratings = self.blend_with_popularity(
+                np.asarray(predicted_ratings).ravel(), candidates
+            )
+
+        return self.select_recommendations(candidates, predicted_ratings, num_items)
+
+    def recommend(self, reviewer_id, num_items):
+        """Recommends a specified number of products for the given reviewer."""
+        if self.cache is None:
+            return self.compute_recommendations(reviewer_id, num_items)
+
+        key = (reviewer_id, num_items, self.model_version)
+        recommendations = self.cache.get(key)
+        if recommendations is None:
+            recommendations = self.compute_recommendations(reviewer_id, num_items)
+            self.cache.put(key, recommendations)
 
         return recommendations
 
-    def recommend_products(self, num_items):
-        """Recommends a specified number of products for the reviewer."""
-        self.load_model()
-        self.load_data()
-        self.load_reviewer_encoder()
-        self.load_params()
-        encoded_reviewer_id = self.preprocess_reviewer()
-        rated_products_id, encoded_rated_products_id = self.preprocess_rated_products()
-        unrated_products = self.find_unrated_products(encoded_rated_products_id)
-        predicted_ratings = self.make_predictions(encoded_reviewer_id, unrated_products)
-        recommendations = self.generate_recommendations(
-            unrated_products, predicted_ratings, num_items
+    def compute_recommendations(self, reviewer_id, num_items):
+        """Computes recommendations for the given reviewer without the cache."""
+        encoded_reviewer_id = self.reviewer_vocabulary.encode(reviewer_id)
+        if encoded_reviewer_id == UNKNOWN_ID:
+            return self.recommend_popular(num_items)
+
+        return self.recommend_encoded(encoded_reviewer_id, num_items)
+
+    def recommend_encoded(self, encoded_reviewer_id, num_items):
+        """Recommends products for an encoded reviewer from the table or the model."""
+        use_top_n_table = self.can_use_top_n_table(num_items)
+        if use_top_n_table and not self.is_cold_start(encoded_reviewer_id):
+            return self.lookup_recommendations(encoded_reviewer_id, num_items)
+
+        num_candidates = None
+        if self.config.use_cascade:
+            num_candidates = self.config.cascade_candidates
+
+        encoded_products, predicted_ratings = self.rank_products(
+            encoded_reviewer_id, num_items, num_candidates
         )
+        return self.build_recommendations(encoded_products, predicted_ratings)
+
+    def score_reviewers(self, encoded_reviewer_ids):
+        """Returns scaled predicted ratings of several reviewers for every product."""
+        self.ensure_model_loaded()
+        if self.config.inference_backend == "numpy":
+            return self.model.score_many(encoded_reviewer_ids)
+
+        example = [
+            np.repeat(encoded_reviewer_ids, self.number_of_products),
+            np.tile(np.arange(self.number_of_products), len(encoded_reviewer_ids))
+        ]
+        with self._predict_lock:
+            predicted_ratings = self.model.predict(
+                example, batch_size=self.number_of_products, verbose=0
+            )
+
+        return predicted_ratings.reshape(len(encoded_reviewer_ids), -1)
+
+    def mask_rated_products(self, encoded_reviewer_ids, scores):
+        """Masks out the products already rated by each reviewer in a score matrix."""
+        starts = self.rated_products_indptr[encoded_reviewer_ids]
+        counts = self.rated_products_indptr[encoded_reviewer_ids + 1] - starts
+        rows = np.repeat(np.arange(len(encoded_reviewer_ids)), counts)
+        row_starts = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+        columns = self.rated_products_indices[row_starts + np.arange(counts.sum())]
+        scores[rows, columns] = -np.inf
+
+    def select_top_items(self, scores, num_items):
+        """Returns the column indices of the highest scores in each row, best first."""
+        num_items = max(min(num_items, scores.shape[1]), 0)
+        if num_items == 0:
+            return np.empty((scores.shape[0], 0), dtype=np.int64)
+
+        top_items = np.argpartition(-scores, num_items - 1, axis=1)[:, :num_items]
+        order = np.argsort(-np.take_along_axis(scores, top_items, axis=1), axis=1)
+        return np.take_along_axis(top_items, order, axis=1)
+
+    def recommend_many(self, reviewer_ids, num_items):
+        """Recommends a specified number of products for each of the given reviewers."""
+        if self.cache is None:
+            return self.compute_many(reviewer_ids, num_items)
+
+        recommendations = {}
+        missing_reviewer_ids = []
+        for reviewer_id in dict.fromkeys(np.asarray(reviewer_ids).tolist()):
+            cached = self.cache.get((reviewer_id, num_items, self.model_version))
+            if cached is None:
+                missing_reviewer_ids.append(reviewer_id)
+            else:
+                recommendations[reviewer_id] = cached
+
+        if missing_reviewer_ids:
+            computed = self.compute_many(missing_reviewer_ids, num_items)
+            for reviewer_id, reviewer_recommendations in computed.items():
+                self.cache.put(
+                    (reviewer_id, num_items, self.model_version),
+                    reviewer_recommendations
+                )
+            recommendations.update(computed)
+
+        return recommendations
+
+    def recommend_in_order(self, reviewer_ids, num_items):
+        """Returns the recommendations of the given reviewers in request order."""
+        reviewer_ids = np.asarray(reviewer_ids).tolist()
+        recommendations = self.recommend_many(reviewer_ids, num_items)
+        return [recommendations[reviewer_id] for reviewer_id in reviewer_ids]
+
+    def compute_many(self, reviewer_ids, num_items):
+        """Computes recommendations for several reviewers without the cache."""
+        reviewer_ids = np.asarray(reviewer_ids)
+        encoded_reviewer_ids = self.reviewer_vocabulary.encode_many(reviewer_ids)
+        known = encoded_reviewer_ids != UNKNOWN_ID
+        encoded_reviewer_ids = encoded_reviewer_ids[known]
+        known_reviewer_ids = reviewer_ids[known].tolist()
+
+        if self.popularity_ranking is not None:
+            unknown = self.recommend_popular(num_items)
+        else:
+            unknown = pd.DataFrame(columns=["recommendedProductID", "predictedRating"])
+        recommendations = {
+            reviewer_id: unknown for reviewer_id in reviewer_ids.tolist()
+        }
+
+        if self.can_use_top_n_table(num_items):
+            for reviewer_id, encoded_reviewer_id in zip(
+                known_reviewer_ids, encoded_reviewer_ids
+            ):
+                recommendations[reviewer_id] = self.recommend_encoded(
+                    encoded_reviewer_id, num_items
+                )
+
+            return recommendations
+
+        for start in range(0, len(encoded_reviewer_ids), self.config.tile_size):
+            tile = encoded_reviewer_ids[start:start + self.config.tile_size]
+            scores = self.score_reviewers(tile)
+            cold_start = self.is_cold_start(tile)
+            if cold_start.any():
+                scores[cold_start] = self.blend_with_popularity(
+                    scores[cold_start], slice(None), scaled=True
+                )
+            self.mask_rated_products(tile, scores)
+            top_items = self.select_top_items(scores, num_items)
+            top_scores = np.take_along_axis(scores, top_items, axis=1)
+            top_ratings = unscale_targets(top_scores, self.min_rating, self.max_rating)
+
+            tile_reviewer_ids = known_reviewer_ids[start:start + len(tile)]
+            for row, reviewer_id in enumerate(tile_reviewer_ids):
+                unrated = np.isfinite(top_scores[row])
+                recommendations[reviewer_id] = pd.DataFrame(
+                    {
+                        "recommendedProductID": self.product_ids[
+                            top_items[row][unrated]
+                        ],
+                        "predictedRating": top_ratings[row][unrated]
+                    }
+                )
 
         return recommendations
+
+
+_engine = None
+_engine_lock = threading.Lock()
+_cache = None
+
+
+def create_recommender_engine():
+    """Creates a RecommenderEngine backed by the process-wide recommendation cache."""
+    global _cache
+
+    config = ConfigurationManager()
+    inference_config = config.get_inference_config()
+
+    if _cache is None:
+        _cache = RecommendationCache(
+            max_bytes=inference_config.cache_max_megabytes * 1024 * 1024,
+            ttl_seconds=inference_config.cache_ttl_seconds
+        )
+    else:
+        _cache.invalidate()
+
+    return RecommenderEngine(inference_config, cache=_cache)
+
+
+def get_recommender_engine():
+    """Returns the process-wide RecommenderEngine, reloading it if the model changed."""
+    global _engine
+
+    if _engine is None or _engine.is_stale():
+        with _engine_lock:
+            if _engine is None or _engine.is_stale():
+                _engine = create_recommender_engine()
+                logger.info(f"Load recommender engine version: {_engine.model_version}")
+
+    return _engine
+
+
+def reload_recommender_engine():
+    """Reloads the process-wide RecommenderEngine from the current artifacts."""
+    global _engine
+
+    with _engine_lock:
+        _engine = create_recommender_engine()
+
+    return _engine
+
+
+def get_cache_stats():
+    """Returns the counters of the process-wide recommendation cache."""
+    if _cache is None:
+        return {}
+
+    return _cache.stats()
+
+
+class RecommendProducts:
+    def __init__(self, reviewer_id):
+        self.reviewer_id = reviewer_id
+
+    def recommend_products(self, num_items):
+        """Recommends a specified number of products for the reviewer."""
+        engine = get_recommender_engine()
+        return engine.recommend(self.reviewer_id, num_items)
@@ -0,0 +1,22 @@
+from recommender_system.components import EvaluateModel, ModelExporter
+from recommender_system.config import ConfigurationManager
+from recommender_system.logging import logger
+
+
+class ModelExportPipeline:
+    def __init__(self):
+        pass
+
+    def main(self):
+        """Executes the main model export pipeline steps."""
+        config_manager = ConfigurationManager()
+        export_config = config_manager.get_export_model_config()
+        model_exporter = ModelExporter(export_config)
+        model_exporter.export_weights()
+        model_exporter.verify_parity()
+        model_exporter.export_quantized_weights()
+        model_exporter.evaluate_quantization(
+            EvaluateModel(config_manager.get_evaluate_model_config())
+        )
+        model_exporter.export_serving_bundle()
+        model_exporter.record_serving_version()
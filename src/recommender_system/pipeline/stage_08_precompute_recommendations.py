@@ -0,0 +1,21 @@
+from dataclasses import replace
+
+from recommender_system.components import RecommendationPrecomputer
+from recommender_system.config import ConfigurationManager
+from recommender_system.logging import logger
+from recommender_system.pipeline.stage_06_inference import RecommenderEngine
+
+
+class PrecomputeRecommendationsPipeline:
+    def __init__(self):
+        pass
+
+    def main(self):
+        """Executes the main top-N recommendation precomputation pipeline steps."""
+        config_manager = ConfigurationManager()
+        inference_config = config_manager.get_inference_config()
+        precompute_config = config_manager.get_precompute_recommendations_config()
+        engine = RecommenderEngine(replace(inference_config, use_top_n_table=False))
+        recommendation_precomputer = RecommendationPrecomputer(precompute_config)
+        recommendation_precomputer.precompute(engine)
+        recommendation_precomputer.record_serving_version()
@@ -0,0 +1,16 @@
+from recommender_system.components import AnnIndexBuilder
+from recommender_system.config import ConfigurationManager
+from recommender_system.logging import logger
+
+
+class AnnIndexPipeline:
+    def __init__(self):
+        pass
+
+    def main(self):
+        """Executes the main product ANN index pipeline steps."""
+        config_manager = ConfigurationManager()
+        ann_index_config = config_manager.get_ann_index_config()
+        ann_index_builder = AnnIndexBuilder(ann_index_config)
+        ann_index_builder.build_index()
+        ann_index_builder.evaluate_recall()
@@ -0,0 +1,20 @@
+from dataclasses import replace
+
+from recommender_system.components import EvaluateCascade
+from recommender_system.config import ConfigurationManager
+from recommender_system.logging import logger
+from recommender_system.pipeline.stage_06_inference import RecommenderEngine
+
+
+class CascadeEvaluationPipeline:
+    def __init__(self):
+        pass
+
+    def main(self):
+        """Executes the main inference cascade evaluation pipeline steps."""
+        config_manager = ConfigurationManager()
+        inference_config = config_manager.get_inference_config()
+        evaluation_config = config_manager.get_evaluate_cascade_config()
+        engine = RecommenderEngine(replace(inference_config, use_top_n_table=False))
+        evaluate_cascade = EvaluateCascade(evaluation_config)
+        evaluate_cascade.evaluate(engine)
@@ -1,5 +1,7 @@
+import hashlib
 import json
 import os
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Union
 
@@ -61,6 +63,62 @@ def get_size(file_path: Path) -> str:
     return f"~ {size_in_kb} KB"
 
 
+@ensure_annotations
+def get_file_hash(file_path: Path) -> str:
+    """Returns the SHA-256 hash of a file's content as a hex string."""
+    file_hash = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            file_hash.update(chunk)
+
+    return file_hash.hexdigest()
+
+
+@contextmanager
+@ensure_annotations
+def atomic_write(file_path: Union[str, Path]):
+    """Yields a temporary path that replaces the file only once it is fully written."""
+    file_path = Path(file_path)
+    temporary_path = file_path.with_name(
+        f".{file_path.stem}.{os.getpid()}.tmp{file_path.suffix}"
+    )
+    try:
+        yield temporary_path
+        with open(temporary_path, "rb+") as file:
+            os.fsync(file.fileno())
+        os.replace(temporary_path, file_path)
+    finally:
+        if temporary_path.exists():
+            temporary_path.unlink()
+
+
+@ensure_annotations
+def get_memory_usage() -> dict:
+    """Returns the resident, anonymous and file-backed memory of the process in KB."""
+    memory_usage = {}
+    try:
+        with open("/proc/self/status") as file:
+            for line in file:
+                key, _, value = line.partition(":")
+                if key in ("VmRSS", "RssAnon", "RssFile", "RssShmem"):
+                    memory_usage[key] = int(value.split()[0])
+    except OSError:
+        import resource
+
+        memory_usage["MaxRSS"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    return memory_usage
+
+
+@ensure_annotations
+def set_seeds(seed_value: int = 42):
+    """Seeds the NumPy and TensorFlow random number generators."""
+    import tensorflow as tf
+
+    np.random.seed(seed_value)
+    tf.random.set_seed(seed_value)
+
+
 @ensure_annotations
 def scale_targets(
     y: Union[float, np.ndarray], min_rating: float, max_rating: float
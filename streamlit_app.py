@@ -54,7 +54,7 @@ def recommend_products(reviewer_id, num_items):
         else:
             st.info("No recommendations found for the given user.")
     except ValueError as e:
-        if "contains previously unseen labels" in str(e):
+        if "Unknown reviewer ID" in str(e):
             st.info("No recommendations found for the given user.")
         else:
             st.error(str(e))
@@ -0,0 +1,94 @@
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+LOAD_METHODS = {
+    "csv": """
+import pandas as pd
+df = pd.read_csv(csv_path)
+rated = df.loc[df["encodedReviewerID"] == 0, "encodedProductID"].to_numpy()
+rows = len(df)
+""",
+    "table": """
+from recommender_system.components import ReviewTable
+review_table = ReviewTable.open(table_path)
+rated = review_table.rated_products(0)
+rows = len(review_table)
+""",
+    "table_frame": """
+from recommender_system.components import ReviewTable
+df = ReviewTable.open(table_path).to_frame()
+rated = df["encodedProductID"].to_numpy()[:1]
+rows = len(df)
+"""
+}
+
+RUNNER = """
+import json
+import resource
+import sys
+import time
+table_path, csv_path = sys.argv[1], sys.argv[2]
+start_time = time.perf_counter()
+{method}
+elapsed = time.perf_counter() - start_time
+peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{"rows": rows, "seconds": elapsed, "peak_rss_kb": peak_kb}}))
+"""
+
+
+def parse_args():
+    """Parses the command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Compares load time and peak memory of the CSV and binary table."
+    )
+    parser.add_argument(
+        "--table-path", default="artifacts/data_preprocessing/preprocessed_data.bin"
+    )
+    return parser.parse_args()
+
+
+def write_csv(table_path, csv_path):
+    """Writes the review table as the CSV the preprocessing stage used to produce."""
+    from recommender_system.components import ReviewTable
+
+    ReviewTable.open(table_path).to_frame().to_csv(csv_path, index=False)
+
+
+def measure_method(method, table_path, csv_path):
+    """Runs a load method in a fresh interpreter and returns its measurements."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            RUNNER.format(method=LOAD_METHODS[method]),
+            table_path,
+            csv_path
+        ],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def main(args):
+    """Reports the load time and peak resident memory of each table format."""
+    with tempfile.TemporaryDirectory() as temporary_dir:
+        csv_path = str(Path(temporary_dir) / "preprocessed_data.csv")
+        write_csv(args.table_path, csv_path)
+
+        for method in LOAD_METHODS:
+            measurement = measure_method(method, args.table_path, csv_path)
+            print(
+                f"{method:>12}: {measurement['rows']} rows in "
+                f"{measurement['seconds'] * 1000:.1f} ms, "
+                f"peak RSS {measurement['peak_rss_kb'] / 1024:.0f} MB"
+            )
+
+
+if __name__ == "__main__":
+    main(parse_args())
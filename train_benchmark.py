@@ -0,0 +1,109 @@
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+
+FIT = {"training_loop": "fit", "jit_compile": False}
+
+TRAIN_CONFIGURATIONS = {
+    "fit_arrays_32": {**FIT, "use_tf_data": False, "large_batch_size": None},
+    "tf_data_32": {**FIT, "use_tf_data": True, "large_batch_size": None},
+    "tf_data_1024": {**FIT, "use_tf_data": True, "large_batch_size": 1024},
+    "tf_data_4096": {**FIT, "use_tf_data": True, "large_batch_size": 4096},
+    "xla_fit_1024": {
+        "training_loop": "fit",
+        "jit_compile": True,
+        "use_tf_data": True,
+        "large_batch_size": 1024
+    },
+    "custom_1024": {
+        "training_loop": "custom",
+        "jit_compile": False,
+        "use_tf_data": True,
+        "large_batch_size": 1024
+    },
+    "xla_custom_1024": {
+        "training_loop": "custom",
+        "jit_compile": True,
+        "use_tf_data": True,
+        "large_batch_size": 1024
+    }
+}
+
+RUNNER = """
+import json
+import math
+import sys
+from dataclasses import replace
+from pathlib import Path
+from recommender_system.components import ModelTrainer
+from recommender_system.config import ConfigurationManager
+from recommender_system.utils import set_seeds
+overrides, model_dir, epochs = json.loads(sys.argv[1]), sys.argv[2], int(sys.argv[3])
+set_seeds()
+config_manager = ConfigurationManager()
+config = replace(
+    config_manager.get_train_model_config(),
+    trained_model_path=Path(model_dir) / "trained_model.h5",
+    epochs=epochs,
+    verbose=0,
+    **overrides
+)
+history = ModelTrainer(config).train_model().history
+rating_range = config_manager.params.MAX_RATING - config_manager.params.MIN_RATING
+throughput = history["examples_per_second"][1:] or history["examples_per_second"]
+examples_per_second = sum(throughput) / len(throughput)
+batch_size = config.large_batch_size or config.batch_size
+print(json.dumps({
+    "examples_per_second": examples_per_second,
+    "steps_per_second": examples_per_second / batch_size,
+    "final_val_loss": history["val_loss"][-1],
+    "val_rmse": math.sqrt(min(history["val_loss"])) * rating_range
+}))
+"""
+
+
+def parse_args():
+    """Parses the command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Compares training throughput and validation loss per setup."
+    )
+    parser.add_argument("--epochs", type=int, default=5)
+    return parser.parse_args()
+
+
+def measure_configuration(configuration, model_dir, epochs):
+    """Trains with a configuration in a fresh interpreter and returns its results."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            RUNNER,
+            json.dumps(TRAIN_CONFIGURATIONS[configuration]),
+            model_dir,
+            str(epochs)
+        ],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def main(args):
+    """Reports the throughput and validation loss of each training configuration."""
+    with tempfile.TemporaryDirectory() as model_dir:
+        for configuration in TRAIN_CONFIGURATIONS:
+            measurement = measure_configuration(configuration, model_dir, args.epochs)
+            print(
+                f"{configuration:>15}: "
+                f"{measurement['examples_per_second']:.0f} examples/sec, "
+                f"{measurement['steps_per_second']:.1f} steps/sec, "
+                f"final val loss {measurement['final_val_loss']:.5f}, "
+                f"best val RMSE {measurement['val_rmse']:.4f}"
+            )
+
+
+if __name__ == "__main__":
+    main(parse_args())